@@ -18,7 +18,7 @@ from omen.vocabulary import (
 )
 
 
-@dataclass
+@dataclass(slots=True)
 class CompiledStep:
     """
     Single compiled step ready for execution.
@@ -42,7 +42,7 @@ class CompiledStep:
     packet_id: str | None = None  # Assigned when packet emitted
 
 
-@dataclass 
+@dataclass(slots=True)
 class CompiledEpisode:
     """
     Complete compiled episode ready for execution.
@@ -67,12 +67,26 @@ class CompiledEpisode:
     current_step: str | None = None
     completed: bool = False
     
+    # step_id -> position of its first occurrence in steps. Hits are checked
+    # against the list, so appends and in-place replacements are picked up.
+    _step_index: dict[str, int] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+    
     def get_step(self, step_id: str) -> CompiledStep | None:
         """Get compiled step by ID."""
-        for step in self.steps:
-            if step.step_id == step_id:
-                return step
-        return None
+        steps = self.steps
+        pos = self._step_index.get(step_id)
+        if pos is not None and pos < len(steps) and steps[pos].step_id == step_id:
+            return steps[pos]
+        
+        # Stale entry or unknown step_id: rebuild from the current list
+        index: dict[str, int] = {}
+        for i, step in enumerate(steps):
+            index.setdefault(step.step_id, i)
+        self._step_index = index
+        pos = index.get(step_id)
+        return None if pos is None else steps[pos]
     
     def get_next_steps(self) -> list[CompiledStep]:
         """Get possible next steps from current position."""
@@ -84,8 +98,5 @@ class CompiledEpisode:
         if current is None:
             return []
         
-        return [
-            self.get_step(sid) 
-            for sid in current.next_steps 
-            if self.get_step(sid)
-        ]
+        steps = [self.get_step(sid) for sid in current.next_steps]
+        return [step for step in steps if step]
@@ -15,6 +15,14 @@ from omen.compiler.context import CompilationContext
 from omen.compiler.compiled import CompiledStep, CompiledEpisode
 
 
+# Quality tier rank, lowest to highest; a new QualityTier member needs an entry.
+_TIER_RANK: dict[QualityTier, int] = {
+    QualityTier.SUBPAR: 0,
+    QualityTier.PAR: 1,
+    QualityTier.SUPERB: 2,
+}
+
+
 @dataclass
 class CompilationError:
     """Error during compilation."""
@@ -73,10 +81,11 @@ class TemplateCompiler:
         if constraint_errors:
             return CompilationResult(success=False, errors=constraint_errors)
         
-        # 3. Compile steps
+        # 3. Compile steps (context bindings are identical for every step)
+        context_bindings = self._build_context_bindings(context)
         compiled_steps = []
         for seq_num, step in enumerate(template.steps):
-            compiled = self._compile_step(step, seq_num, context, template)
+            compiled = self._compile_step(step, seq_num, context_bindings, template)
             compiled_steps.append(compiled)
         
         # 4. Build compiled episode
@@ -105,13 +114,7 @@ class TemplateCompiler:
         constraints = template.constraints
         
         # Check quality tier
-        # NOTE: Depends on enum order. If QualityTier values change, update this.
-        # Tests will catch mismatches immediately.
-        tier_order = [QualityTier.SUBPAR, QualityTier.PAR, QualityTier.SUPERB]
-        context_tier_idx = tier_order.index(context.quality.quality_tier)
-        required_tier_idx = tier_order.index(constraints.min_tier)
-        
-        if context_tier_idx < required_tier_idx:
+        if _TIER_RANK[context.quality.quality_tier] < _TIER_RANK[constraints.min_tier]:
             errors.append(CompilationError(
                 None,
                 f"Context tier {context.quality.quality_tier.value} "
@@ -132,12 +135,12 @@ class TemplateCompiler:
         self,
         step: TemplateStep,
         sequence_number: int,
-        context: CompilationContext,
+        context_bindings: dict[str, Any],
         template: EpisodeTemplate,
     ) -> CompiledStep:
         """Compile a single template step."""
         # Build MCP bindings from context + step bindings
-        mcp_bindings = self._build_mcp_bindings(context, step.bindings)
+        mcp_bindings = self._build_mcp_bindings(context_bindings, step.bindings)
         
         return CompiledStep(
             step_id=step.step_id,
@@ -153,11 +156,20 @@ class TemplateCompiler:
     
     def _build_mcp_bindings(
         self,
-        context: CompilationContext,
+        context_bindings: dict[str, Any],
         step_bindings: dict[str, Any],
     ) -> dict[str, Any]:
-        """Build MCP field bindings from context and step overrides."""
-        bindings = {
+        """
+        Build MCP field bindings from context bindings and step overrides.
+        
+        Only the top level is copied; nested sections are shared between
+        the steps of an episode and must be treated as read-only.
+        """
+        return {**context_bindings, **step_bindings}
+    
+    def _build_context_bindings(self, context: CompilationContext) -> dict[str, Any]:
+        """Build the MCP field bindings shared by every step of an episode."""
+        return {
             # From context
             "correlation_id": str(context.correlation_id),
             "campaign_id": context.campaign_id,
@@ -197,11 +209,6 @@ class TemplateCompiler:
             },
             # Intent left unbound - filled at runtime by layer
         }
-        
-        # Apply step-specific overrides
-        bindings.update(step_bindings)
-        
-        return bindings
     
     def _snapshot_context(self, context: CompilationContext) -> dict[str, Any]:
         """Create serializable snapshot of compilation context."""
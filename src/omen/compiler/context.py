@@ -94,7 +94,7 @@ def create_context(
     stakes_level: StakesLevel = StakesLevel.LOW,
     quality_tier: QualityTier = QualityTier.PAR,
     tools_state: ToolsState = ToolsState.TOOLS_OK,
-    **kwargs
+    **kwargs: Any,
 ) -> CompilationContext:
     """Factory for common compilation contexts."""
     return CompilationContext(
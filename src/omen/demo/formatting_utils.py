@@ -5,9 +5,23 @@ Provides ASCII art, progress bars, and text formatting helpers for
 generating human-readable transcripts of OMEN episode executions.
 """
 
+from functools import lru_cache
 from typing import Any
 
 
+# Preallocated bar glyphs; bars up to this width are sliced, not multiplied
+_BAR_CACHE_WIDTH = 128
+_FULL_BAR = "█" * _BAR_CACHE_WIDTH
+_EMPTY_BAR = "-" * _BAR_CACHE_WIDTH
+
+
+def _bar(filled: int, width: int) -> str:
+    """Build the fill/empty body of a progress bar."""
+    empty = width - filled
+    if 0 <= filled <= _BAR_CACHE_WIDTH and 0 <= empty <= _BAR_CACHE_WIDTH:
+        return _FULL_BAR[:filled] + _EMPTY_BAR[:empty]
+    return "█" * filled + "-" * empty
+
 def format_progress_bar(consumed: int, total: int, width: int = 20) -> str:
     """
     Generate ASCII progress bar.
@@ -25,13 +39,10 @@ def format_progress_bar(consumed: int, total: int, width: int = 20) -> str:
         '[███████████████-----] 75.0%'
     """
     if total <= 0:
-        return f"[{'-' * width}] 0.0%"
+        return f"[{_bar(0, width)}] 0.0%"
     
     pct = consumed / total
-    filled = int(width * pct)
-    empty = width - filled
-    bar = "█" * filled + "-" * empty
-    return f"[{bar}] {pct * 100:.1f}%"
+    return f"[{_bar(int(width * pct), width)}] {pct * 100:.1f}%"
 
 
 def format_duration(seconds: float) -> str:
@@ -169,6 +180,8 @@ def _get_packet_type(packet: Any) -> str:
     return getattr(packet, "__class__", type(packet)).__name__
 
 
+# Headers come from a small fixed set of titles and widths
+@lru_cache(maxsize=256)
 def format_section_header(title: str, width: int = 80, char: str = "=") -> str:
     """
     Generate section header with border.
@@ -189,6 +202,7 @@ def format_section_header(title: str, width: int = 80, char: str = "=") -> str:
     return f"{title}\n{border}"
 
 
+@lru_cache(maxsize=256)
 def format_box_header(title: str, width: int = 77) -> str:
     """
     Generate a box-style header for steps.
@@ -229,12 +243,9 @@ def format_mini_progress_bar(consumed: int, total: int, width: int = 10) -> str:
         '[████████--]'
     """
     if total <= 0:
-        return f"[{'-' * width}]"
+        return f"[{_bar(0, width)}]"
     
-    pct = consumed / total
-    filled = int(width * pct)
-    empty = width - filled
-    return "[" + "█" * filled + "-" * empty + "]"
+    return f"[{_bar(int(width * (consumed / total)), width)}]"
 
 
 def format_timestamp(dt: Any) -> str:
@@ -292,11 +303,12 @@ def truncate_text(text: str, max_length: int, suffix: str = "...") -> str:
     Returns:
         Truncated text with indication of hidden chars
     """
-    if len(text) <= max_length:
+    length = len(text)
+    if length <= max_length:
         return text
     
-    hidden = len(text) - (max_length - len(suffix))
-    return text[:max_length - len(suffix)] + f"...\n[truncated - {hidden} chars hidden]"
+    keep = max_length - len(suffix)
+    return text[:keep] + f"...\n[truncated - {length - keep} chars hidden]"
 
 
 def format_budget_delta(consumed: int | float, budget_name: str) -> str:
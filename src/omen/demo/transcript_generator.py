@@ -13,19 +13,19 @@ Usage:
     generator = CognitiveTranscriptGenerator()
     generator.from_episode_result(result)
     transcript = generator.generate_transcript()
-    generator.save("episode_transcript.txt")
+    generator.save("episode_transcript.txt", transcript)
 """
 
 from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
-from typing import Any
-from uuid import UUID
+from typing import Any, Iterator, TYPE_CHECKING
+from uuid import UUID, uuid4
+import os
 import re
 import json
 
-from omen.orchestrator import EpisodeResult, StepResult
-from omen.vocabulary import LayerSource, PacketType
+from omen.vocabulary import LayerSource
 from omen.demo.formatting_utils import (
     format_progress_bar,
     format_duration,
@@ -41,12 +41,30 @@ from omen.demo.formatting_utils import (
     format_budget_delta,
 )
 
+if TYPE_CHECKING:
+    from omen.orchestrator import EpisodeResult, StepResult
+
+
+# Full-width rule framing the transcript header and footer
+_RULE = "=" * 80
+
+# Human-readable layer names, built once rather than per step rendered
+_LAYER_NAMES: dict[LayerSource, str] = {
+    LayerSource.LAYER_1: "Aspirational",
+    LayerSource.LAYER_2: "Global Strategy",
+    LayerSource.LAYER_3: "Agent Model",
+    LayerSource.LAYER_4: "Executive Function",
+    LayerSource.LAYER_5: "Cognitive Control",
+    LayerSource.LAYER_6: "Task Prosecution",
+    LayerSource.INTEGRITY: "Integrity Monitor",
+}
+
 
 # =============================================================================
 # DATA CAPTURE STRUCTURES
 # =============================================================================
 
-@dataclass
+@dataclass(slots=True)
 class StepCapture:
     """Captures all data for a single step."""
     step_id: str
@@ -78,7 +96,7 @@ class StepCapture:
     error_message: str | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class EpisodeCapture:
     """Complete capture of episode execution."""
     correlation_id: UUID
@@ -137,7 +155,7 @@ class CognitiveTranscriptGenerator:
         generator = CognitiveTranscriptGenerator()
         generator.from_episode_result(result)
         transcript = generator.generate_transcript()
-        generator.save("episode_001.txt")
+        generator.save("episode_001.txt", transcript)
     """
     
     def __init__(
@@ -162,7 +180,7 @@ class CognitiveTranscriptGenerator:
     
     def from_episode_result(
         self,
-        result: EpisodeResult,
+        result: "EpisodeResult",
         debug_captures: dict[str, Any] | None = None,
         layer_prompts: dict[LayerSource, str] | None = None,
     ) -> None:
@@ -176,6 +194,7 @@ class CognitiveTranscriptGenerator:
         """
         # Extract ledger summary
         ledger = result.ledger_summary
+        budget = ledger.get("budget", {})
         
         # Build episode capture
         self.capture = EpisodeCapture(
@@ -187,11 +206,11 @@ class CognitiveTranscriptGenerator:
             stakes_level=ledger.get("stakes_level", "UNKNOWN"),
             quality_tier=ledger.get("quality_tier", "UNKNOWN"),
             tools_state=ledger.get("tools_state", "UNKNOWN"),
-            token_budget=ledger.get("budget", {}).get("token_budget", 0),
-            token_consumed=ledger.get("budget", {}).get("tokens_consumed", 0),
-            tool_budget=ledger.get("budget", {}).get("tool_call_budget", 0),
-            tool_consumed=ledger.get("budget", {}).get("tool_calls_consumed", 0),
-            time_budget=ledger.get("budget", {}).get("time_budget_seconds", 0),
+            token_budget=budget.get("token_budget", 0),
+            token_consumed=budget.get("tokens_consumed", 0),
+            tool_budget=budget.get("tool_call_budget", 0),
+            tool_consumed=budget.get("tool_calls_consumed", 0),
+            time_budget=budget.get("time_budget_seconds", 0),
             time_consumed=result.total_duration_seconds,
             initial_seed=ledger.get("initial_seed", ""),
             success=result.success,
@@ -247,7 +266,7 @@ class CognitiveTranscriptGenerator:
     
     def _convert_step_result(
         self,
-        step_result: StepResult,
+        step_result: "StepResult",
         debug_captures: dict[str, Any] | None,
         layer_prompts: dict[LayerSource, str] | None,
     ) -> StepCapture:
@@ -260,24 +279,24 @@ class CognitiveTranscriptGenerator:
         # Extract LLM reasoning from raw response if available
         llm_reasoning = None
         raw_response = None
-        if step_result.output:
-            raw_response = step_result.output.raw_response
+        output = step_result.output
+        if output:
+            raw_response = output.raw_response
             if self.include_llm_reasoning and raw_response:
                 llm_reasoning = self._extract_reasoning(raw_response)
         
         # Build tool calls list
-        tool_calls = []
-        for tool_exec in step_result.tool_executions:
-            tool_calls.append(tool_exec.to_dict())
+        tool_calls = [tool_exec.to_dict() for tool_exec in step_result.tool_executions]
         
         # Get packets emitted
-        packets = step_result.packets_emitted_list if hasattr(step_result, 'packets_emitted_list') else []
+        packets = getattr(step_result, 'packets_emitted_list', [])
         
         # Infer FSM state if not provided
-        fsm_state = self._infer_fsm_state(step_result.step_id, step_result.fsm_state or "")
+        step_id = step_result.step_id
+        fsm_state = self._infer_fsm_state(step_id, step_result.fsm_state or "")
         
         return StepCapture(
-            step_id=step_result.step_id,
+            step_id=step_id,
             layer=step_result.layer,
             fsm_state=fsm_state,
             duration_seconds=step_result.duration_seconds,
@@ -393,27 +412,61 @@ class CognitiveTranscriptGenerator:
         Returns:
             Multi-section formatted transcript
         """
-        if self.capture is None:
-            raise ValueError("No episode captured. Call from_episode_result() first.")
+        return "".join(self._iter_transcript())
+    
+    def save(self, filepath: str | Path, transcript: str | None = None) -> None:
+        """
+        Save transcript to file, writing one section at a time.
         
-        sections = [
-            self._generate_header(),
-            self._generate_step_flow(),
-            self._generate_packet_trace(),
-            self._generate_budget_timeline(),
-            self._generate_epistemic_report(),
-            self._generate_integrity_report(),
-            self._generate_summary(),
-        ]
+        Sections stream into a sibling temp file that replaces filepath only
+        once every section rendered, so a failure leaves any existing file
+        untouched.
         
-        return "\n\n".join(sections)
-    
-    def save(self, filepath: str | Path) -> None:
-        """Save transcript to file."""
-        transcript = self.generate_transcript()
+        Args:
+            filepath: Destination file
+            transcript: Text already returned by generate_transcript(),
+                written as-is instead of rendering again
+        """
+        if transcript is not None:
+            fragments: Iterator[str] = iter((transcript,))
+        else:
+            fragments = self._iter_transcript()
+        # Render the first section before touching the filesystem so a
+        # missing capture raises without leaving a file behind
+        first = next(fragments)
         filepath = Path(filepath)
-        filepath.parent.mkdir(parents=True, exist_ok=True)
-        filepath.write_text(transcript, encoding="utf-8")
+        tmp_path = filepath.with_name(f".{filepath.name}.{uuid4().hex[:8]}.tmp")
+        try:
+            f = tmp_path.open("w", encoding="utf-8", buffering=1 << 16)
+        except FileNotFoundError:
+            # Only pay for directory creation when the parent is missing
+            filepath.parent.mkdir(parents=True, exist_ok=True)
+            f = tmp_path.open("w", encoding="utf-8", buffering=1 << 16)
+        try:
+            with f:
+                f.write(first)
+                f.writelines(fragments)
+            os.replace(tmp_path, filepath)
+        except BaseException:
+            tmp_path.unlink(missing_ok=True)
+            raise
+    
+    def _iter_transcript(self) -> Iterator[str]:
+        """Yield transcript sections and their separators in order."""
+        if self.capture is None:
+            raise ValueError("No episode captured. Call from_episode_result() first.")
+        
+        yield self._generate_header()
+        for generate_section in (
+            self._generate_step_flow,
+            self._generate_packet_trace,
+            self._generate_budget_timeline,
+            self._generate_epistemic_report,
+            self._generate_integrity_report,
+            self._generate_summary,
+        ):
+            yield "\n\n"
+            yield generate_section()
     
     # =========================================================================
     # SECTION GENERATORS
@@ -424,9 +477,9 @@ class CognitiveTranscriptGenerator:
         c = self.capture
         
         lines = [
-            "=" * 80,
+            _RULE,
             "COGNITIVE EPISODE TRANSCRIPT",
-            "=" * 80,
+            _RULE,
             format_key_value("Episode ID", str(c.correlation_id)),
             format_key_value("Template", c.template_id),
         ]
@@ -495,7 +548,7 @@ class CognitiveTranscriptGenerator:
                 f"  \"{truncate_text(c.initial_seed, 200)}\"",
             ])
         
-        lines.append("=" * 80)
+        lines.append(_RULE)
         
         return "\n".join(lines)
     
@@ -623,12 +676,16 @@ class CognitiveTranscriptGenerator:
             "",
         ]
         
-        # Per-step token breakdown
+        # Per-step token breakdown; per-layer time is summed in the same pass
+        layer_times: dict[LayerSource, float] = {}
         if c.steps:
+            token_budget = c.token_budget
             lines.append("  Breakdown by step:")
             for i, step in enumerate(c.steps, 1):
-                pct = format_percentage(step.tokens_consumed / c.token_budget if c.token_budget > 0 else 0)
-                lines.append(f"    Step {i} ({step.step_id}): {step.tokens_consumed} tokens ({pct})")
+                tokens = step.tokens_consumed
+                pct = format_percentage(tokens / token_budget if token_budget > 0 else 0)
+                lines.append(f"    Step {i} ({step.step_id}): {tokens} tokens ({pct})")
+                layer_times[step.layer] = layer_times.get(step.layer, 0) + step.duration_seconds
             lines.append("")
         
         # Tool call budget
@@ -646,11 +703,7 @@ class CognitiveTranscriptGenerator:
         ])
         
         # Layer breakdown
-        if c.steps:
-            layer_times: dict[LayerSource, float] = {}
-            for step in c.steps:
-                layer_times[step.layer] = layer_times.get(step.layer, 0) + step.duration_seconds
-            
+        if layer_times:
             lines.append("  Breakdown by layer:")
             for layer, time_spent in sorted(layer_times.items(), key=lambda x: x[1], reverse=True):
                 pct = format_percentage(time_spent / c.time_consumed if c.time_consumed > 0 else 0)
@@ -802,9 +855,9 @@ class CognitiveTranscriptGenerator:
         
         lines.extend([
             "",
-            "=" * 80,
+            _RULE,
             "END OF TRANSCRIPT",
-            "=" * 80,
+            _RULE,
         ])
         
         return "\n".join(lines)
@@ -815,13 +868,4 @@ class CognitiveTranscriptGenerator:
     
     def _get_layer_name(self, layer: LayerSource) -> str:
         """Get human-readable layer name."""
-        layer_names = {
-            LayerSource.LAYER_1: "Aspirational",
-            LayerSource.LAYER_2: "Global Strategy",
-            LayerSource.LAYER_3: "Agent Model",
-            LayerSource.LAYER_4: "Executive Function",
-            LayerSource.LAYER_5: "Cognitive Control",
-            LayerSource.LAYER_6: "Task Prosecution",
-            LayerSource.INTEGRITY: "Integrity Monitor",
-        }
-        return layer_names.get(layer, "Unknown")
+        return _LAYER_NAMES.get(layer, "Unknown")
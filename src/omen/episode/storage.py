@@ -7,6 +7,7 @@ Provides storage backends for saving, loading, and querying episodes.
 import json
 import sqlite3
 from abc import ABC, abstractmethod
+from collections.abc import Iterable
 from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
@@ -16,6 +17,18 @@ from uuid import UUID
 from omen.episode.record import EpisodeRecord
 
 
+_INSERT_EPISODE_SQL = """
+    INSERT OR REPLACE INTO episodes 
+    (correlation_id, template_id, campaign_id, started_at, 
+     completed_at, success, duration_seconds, step_count, data)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+# Encoder for the stored data column. Compact separators keep json on its
+# C encoder (indent=2 does not); one instance avoids a JSONEncoder per row.
+_ROW_ENCODER = json.JSONEncoder(separators=(",", ":"))
+
+
 @runtime_checkable
 class EpisodeStore(Protocol):
     """
@@ -68,6 +81,10 @@ class InMemoryStore:
     def save(self, episode: EpisodeRecord) -> None:
         self._episodes[episode.correlation_id] = episode
     
+    def save_many(self, episodes: Iterable[EpisodeRecord]) -> None:
+        """Save several episode records."""
+        self._episodes.update((e.correlation_id, e) for e in episodes)
+    
     def load(self, correlation_id: UUID) -> EpisodeRecord | None:
         return self._episodes.get(correlation_id)
     
@@ -75,10 +92,7 @@ class InMemoryStore:
         return correlation_id in self._episodes
     
     def delete(self, correlation_id: UUID) -> bool:
-        if correlation_id in self._episodes:
-            del self._episodes[correlation_id]
-            return True
-        return False
+        return self._episodes.pop(correlation_id, None) is not None
     
     def query(
         self,
@@ -163,24 +177,30 @@ class SQLiteStore:
     
     def save(self, episode: EpisodeRecord) -> None:
         with sqlite3.connect(self.db_path) as conn:
-            conn.execute("""
-                INSERT OR REPLACE INTO episodes 
-                (correlation_id, template_id, campaign_id, started_at, 
-                 completed_at, success, duration_seconds, step_count, data)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """, (
-                str(episode.correlation_id),
-                episode.template_id,
-                episode.campaign_id,
-                episode.started_at.isoformat(),
-                episode.completed_at.isoformat() if episode.completed_at else None,
-                1 if episode.success else 0,
-                episode.duration_seconds,
-                episode.step_count,
-                episode.to_json(),
-            ))
+            conn.execute(_INSERT_EPISODE_SQL, self._to_row(episode))
             conn.commit()
     
+    def save_many(self, episodes: Iterable[EpisodeRecord]) -> None:
+        """Save several episode records in one transaction."""
+        with sqlite3.connect(self.db_path) as conn:
+            conn.executemany(_INSERT_EPISODE_SQL, map(self._to_row, episodes))
+            conn.commit()
+    
+    @staticmethod
+    def _to_row(episode: EpisodeRecord) -> tuple[Any, ...]:
+        """Column values for an episode row."""
+        return (
+            str(episode.correlation_id),
+            episode.template_id,
+            episode.campaign_id,
+            episode.started_at.isoformat(),
+            episode.completed_at.isoformat() if episode.completed_at else None,
+            1 if episode.success else 0,
+            episode.duration_seconds,
+            episode.step_count,
+            _ROW_ENCODER.encode(episode.to_dict()),
+        )
+    
     def load(self, correlation_id: UUID) -> EpisodeRecord | None:
         with sqlite3.connect(self.db_path) as conn:
             cursor = conn.execute(
@@ -248,7 +268,8 @@ class SQLiteStore:
                 LIMIT ?
             """, params)
             
-            return [EpisodeRecord.from_json(row[0]) for row in cursor.fetchall()]
+            # Iterate the cursor so raw rows are not held alongside the records
+            return [EpisodeRecord.from_json(data) for (data,) in cursor]
     
     def count(self) -> int:
         with sqlite3.connect(self.db_path) as conn:
@@ -86,13 +86,10 @@ class ActiveToken:
     @property
     def is_valid(self) -> bool:
         """Check if token is still valid."""
-        if self.revoked:
+        if self.revoked or self.uses_remaining <= 0:
             return False
-        if datetime.now() > self.expires_at:
-            return False
-        if self.uses_remaining <= 0:
-            return False
-        return True
+        # Clock read last: it is the only check that is not a field read
+        return datetime.now() <= self.expires_at
     
     def use(self) -> bool:
         """Use the token once. Returns False if invalid."""
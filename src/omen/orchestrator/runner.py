@@ -6,6 +6,7 @@ Coordinates layer invocation, bus routing, and ledger updates.
 Spec: OMEN.md §10.4, §11.4
 """
 
+import time
 from dataclasses import dataclass, field
 from datetime import datetime
 from typing import Any
@@ -20,6 +21,22 @@ from omen.orchestrator.pool import LayerPool
 from omen.tools.base import ToolResult
 
 
+# Packet types routed up (telemetry) and down (commands) the bus stack
+_NORTHBOUND_TYPES = frozenset({
+    PacketType.OBSERVATION,
+    PacketType.TASK_RESULT,
+    PacketType.BELIEF_UPDATE,
+    PacketType.ESCALATION,
+    PacketType.INTEGRITY_ALERT,
+})
+_SOUTHBOUND_TYPES = frozenset({
+    PacketType.DECISION,
+    PacketType.VERIFICATION_PLAN,
+    PacketType.TOOL_AUTHORIZATION,
+    PacketType.TASK_DIRECTIVE,
+})
+
+
 # =============================================================================
 # RUN RESULT
 # =============================================================================
@@ -147,7 +164,7 @@ class EpisodeRunner:
         Returns:
             EpisodeResult with execution details
         """
-        start_time = datetime.now()
+        start_time = time.perf_counter()
         step_results: list[StepResult] = []
         errors: list[str] = []
         
@@ -204,8 +221,7 @@ class EpisodeRunner:
             errors.append(f"Max steps ({self.max_steps}) exceeded")
         
         # Complete episode
-        end_time = datetime.now()
-        duration = (end_time - start_time).total_seconds()
+        duration = time.perf_counter() - start_time
         ledger.complete_episode()
         
         return EpisodeResult(
@@ -227,57 +243,62 @@ class EpisodeRunner:
         input_packets: list[Any],
     ) -> StepResult:
         """Execute a single step."""
-        start_time = datetime.now()
+        start_time = time.perf_counter()
+        step_id = step.step_id
+        owner_layer = step.owner_layer
         
         # Check if layer exists
-        if not self.layer_pool.has_layer(step.owner_layer):
+        if not self.layer_pool.has_layer(owner_layer):
             return StepResult(
-                step_id=step.step_id,
-                layer=step.owner_layer,
+                step_id=step_id,
+                layer=owner_layer,
                 success=False,
-                error=f"Layer {step.owner_layer.value} not in pool",
+                error=f"Layer {owner_layer.value} not in pool",
             )
         
         # Skip if no packet type (terminal/transition step)
         if step.packet_type is None:
-            duration = (datetime.now() - start_time).total_seconds()
+            duration = time.perf_counter() - start_time
             return StepResult(
-                step_id=step.step_id,
-                layer=step.owner_layer,
+                step_id=step_id,
+                layer=owner_layer,
                 success=True,
                 packets_emitted=0,
                 duration_seconds=duration,
             )
         
+        template_id = episode.template_id.value
+        mcp_bindings = step.mcp_bindings
+        fsm_state = step.fsm_state.value if step.fsm_state else ""
+        
         # Build layer input
         layer_input = LayerInput(
             packets=input_packets,
             correlation_id=episode.correlation_id,
             campaign_id=episode.campaign_id,
             context={
-                "step_id": step.step_id,
-                "template_id": episode.template_id.value,
-                "mcp_bindings": step.mcp_bindings,
+                "step_id": step_id,
+                "template_id": template_id,
+                "mcp_bindings": mcp_bindings,
             },
         )
         
         # Capture budget state before execution
-        budget_before = {
-            "tokens": ledger.budget.tokens_consumed,
-            "tool_calls": ledger.budget.tool_calls_consumed,
-            "time": ledger.budget.time_consumed_seconds,
-        }
+        budget = ledger.budget
+        tokens_before = budget.tokens_consumed
+        tool_calls_before = budget.tool_calls_consumed
+        time_before = budget.time_consumed_seconds
         
         # Invoke layer
-        output = self.layer_pool.invoke_layer(step.owner_layer, layer_input)
+        output = self.layer_pool.invoke_layer(owner_layer, layer_input)
         
         if output is None:
             return StepResult(
-                step_id=step.step_id,
-                layer=step.owner_layer,
+                step_id=step_id,
+                layer=owner_layer,
                 success=False,
-                error=f"Layer {step.owner_layer.value} invocation failed",
-                fsm_state=step.fsm_state.value if step.fsm_state else "",
+                error=f"Layer {owner_layer.value} invocation failed",
+                fsm_state=fsm_state,
             )
         
         # Route output packets via buses
@@ -286,37 +307,27 @@ class EpisodeRunner:
         # Update ledger with consumption
         self._update_ledger_from_output(output, ledger)
         
-        duration = (datetime.now() - start_time).total_seconds()
-        
-        # Calculate budget deltas
-        budget_after = {
-            "tokens": ledger.budget.tokens_consumed,
-            "tool_calls": ledger.budget.tool_calls_consumed,
-            "time": ledger.budget.time_consumed_seconds,
-        }
-        
-        tokens_delta = budget_after["tokens"] - budget_before["tokens"]
-        tool_calls_delta = budget_after["tool_calls"] - budget_before["tool_calls"]
-        time_delta = budget_after["time"] - budget_before["time"]
+        duration = time.perf_counter() - start_time
+        packets = output.packets
         
         return StepResult(
-            step_id=step.step_id,
-            layer=step.owner_layer,
+            step_id=step_id,
+            layer=owner_layer,
             success=output.success,
             output=output,
-            packets_emitted=len(output.packets),
+            packets_emitted=len(packets),
             error="; ".join(output.errors) if output.errors else None,
             duration_seconds=duration,
-            # New fields for transcript generation
-            tokens_consumed=tokens_delta,
-            tool_calls_consumed=tool_calls_delta,
-            time_consumed=time_delta,
+            # New fields for transcript generation (budget deltas for this step)
+            tokens_consumed=budget.tokens_consumed - tokens_before,
+            tool_calls_consumed=budget.tool_calls_consumed - tool_calls_before,
+            time_consumed=budget.time_consumed_seconds - time_before,
             context_summary={
-                "template_id": episode.template_id.value,
-                "mcp_bindings": step.mcp_bindings,
+                "template_id": template_id,
+                "mcp_bindings": mcp_bindings,
             },
-            packets_emitted_list=output.packets if output else [],
-            fsm_state=step.fsm_state.value if step.fsm_state else "",
+            packets_emitted_list=packets,
+            fsm_state=fsm_state,
         )
     
     def _route_packets(
@@ -325,39 +336,35 @@ class EpisodeRunner:
         ledger: EpisodeLedger,
     ) -> None:
         """Route output packets via appropriate buses."""
+        source_layer = output.layer
+        correlation_id = output.correlation_id
+        get_packet_type = self._get_packet_type
+        publish_north = self.northbound_bus.publish
+        publish_south = self.southbound_bus.publish
+        
         for packet in output.packets:
             # Determine routing direction based on source layer
             message = BusMessage(
                 packet=packet,
-                source_layer=output.layer,
+                source_layer=source_layer,
                 target_layer=None,  # Broadcast
-                correlation_id=output.correlation_id,
+                correlation_id=correlation_id,
             )
             
             # Route based on packet type and source
             # Observations/Results go northbound (telemetry up)
             # Directives go southbound (commands down)
-            packet_type = self._get_packet_type(packet)
+            packet_type = get_packet_type(packet)
             
-            if packet_type in {
-                PacketType.OBSERVATION,
-                PacketType.TASK_RESULT,
-                PacketType.BELIEF_UPDATE,
-                PacketType.ESCALATION,
-                PacketType.INTEGRITY_ALERT,
-            }:
-                self.northbound_bus.publish(message)
-            elif packet_type in {
-                PacketType.DECISION,
-                PacketType.VERIFICATION_PLAN,
-                PacketType.TOOL_AUTHORIZATION,
-                PacketType.TASK_DIRECTIVE,
-            }:
-                self.southbound_bus.publish(message)
+            if packet_type in _NORTHBOUND_TYPES:
+                publish_north(message)
+            elif packet_type in _SOUTHBOUND_TYPES:
+                publish_south(message)
             
             # Track evidence refs
-            if hasattr(packet, 'evidence_refs'):
-                for ref in packet.evidence_refs:
+            evidence_refs = getattr(packet, 'evidence_refs', None)
+            if evidence_refs is not None:
+                for ref in evidence_refs:
                     ledger.add_evidence(ref)
     
     def _update_ledger_from_output(
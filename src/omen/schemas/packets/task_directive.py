@@ -14,7 +14,7 @@ from uuid import UUID
 
 from pydantic import BaseModel, Field, field_validator
 
-from omen.vocabulary import PacketType, TaskClass, ToolSafety, ToolsState
+from omen.vocabulary import PacketType, TaskClass, ToolSafety, ToolsState, WRITE_SAFETIES
 from omen.schemas.header import PacketHeader
 from omen.schemas.mcp import MCP
 
@@ -192,7 +192,7 @@ class TaskDirectivePacket(BaseModel):
     def validate_write_authorization(cls, v: TaskDirectivePayload) -> TaskDirectivePayload:
         """WRITE/MIXED tools require authorization token."""
         has_write_tools = any(
-            t.tool_safety in (ToolSafety.WRITE, ToolSafety.MIXED) 
+            t.tool_safety in WRITE_SAFETIES
             for t in v.tools
         )
         if has_write_tools and v.constraints.require_authorization_token:
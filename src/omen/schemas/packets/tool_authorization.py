@@ -10,7 +10,7 @@ Tokens gate dangerous operations. They are:
 Spec: OMEN.md §9.3, §8.3.6, §10.4, §12
 """
 
-from datetime import datetime
+from datetime import datetime, timezone
 from typing import Any
 from uuid import UUID
 
@@ -229,8 +229,7 @@ class ToolAuthorizationToken(BaseModel):
         Returns (is_valid, reason).
         """
         if now is None:
-            from datetime import timezone as tz
-            now = datetime.now(tz.utc)
+            now = datetime.now(timezone.utc)
         
         if self.payload.revoked:
             return False, f"Token revoked: {self.payload.revoked_reason}"
@@ -7,12 +7,12 @@ All observations about current state should flow through tool execution.
 Spec: OMEN.md §5 (Vat Boundary)
 """
 
+import secrets
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
 from typing import Any, Protocol, runtime_checkable
-from uuid import uuid4
 
 
 class ToolSafety(Enum):
@@ -29,7 +29,7 @@ class EvidenceRef:
     
     Links observations to their grounding in reality.
     """
-    ref_id: str = field(default_factory=lambda: f"ev_{uuid4().hex[:12]}")
+    ref_id: str = field(default_factory=lambda: f"ev_{secrets.token_hex(6)}")
     ref_type: str = "tool_output"
     tool_name: str = ""
     timestamp: datetime = field(default_factory=datetime.now)
@@ -13,6 +13,12 @@ if TYPE_CHECKING:
     from omen.orchestrator.ledger import ActiveToken
 
 
+# Tools carry tools.base.ToolSafety, a plain Enum distinct from the packet
+# vocabulary's ToolSafety, so omen.vocabulary.WRITE_SAFETIES never matches
+# them. Keep this set in step with it.
+_WRITE_SAFETIES = frozenset({ToolSafety.WRITE, ToolSafety.MIXED})
+
+
 class UnauthorizedToolError(Exception):
     """Raised when tool execution lacks required authorization."""
     pass
@@ -86,7 +92,7 @@ class ToolRegistry:
             raise ToolNotFoundError(f"Tool not found: {tool_name}")
         
         # Check authorization for non-READ tools
-        if tool.safety in {ToolSafety.WRITE, ToolSafety.MIXED}:
+        if tool.safety in _WRITE_SAFETIES:
             if token is None:
                 raise UnauthorizedToolError(
                     f"Tool '{tool_name}' requires authorization token"
@@ -0,0 +1,31 @@
+"""
+Enum members the validators compare on every packet.
+
+Reading an enum member such as PacketType.DECISION goes through the enum
+class machinery (~6x a module global read), so the hot checks bind them here.
+"""
+
+from omen.vocabulary import (
+    DecisionOutcome,
+    EpistemicStatus,
+    FSMState,
+    PacketType,
+    QualityTier,
+)
+
+
+DECISION = PacketType.DECISION
+TASK_DIRECTIVE = PacketType.TASK_DIRECTIVE
+INTEGRITY_ALERT = PacketType.INTEGRITY_ALERT
+
+S3_DECIDE = FSMState.S3_DECIDE
+S5_AUTHORIZE = FSMState.S5_AUTHORIZE
+
+ACT = DecisionOutcome.ACT
+VERIFY_FIRST = DecisionOutcome.VERIFY_FIRST
+
+SUBPAR = QualityTier.SUBPAR
+SUPERB = QualityTier.SUPERB
+
+OBSERVED = EpistemicStatus.OBSERVED
+DERIVED = EpistemicStatus.DERIVED
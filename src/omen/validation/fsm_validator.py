@@ -10,12 +10,21 @@ Second validation gate. Ensures cognitive flow is correct:
 Spec: OMEN.md §10.2, §10.3, §15.4
 """
 
+from collections.abc import Callable, Iterable
 from dataclasses import dataclass, field
 from typing import Any
 from uuid import UUID
 
-from omen.vocabulary import FSMState, PacketType, DecisionOutcome, ToolSafety
+from omen.vocabulary import FSMState, PacketType, DecisionOutcome, WRITE_SAFETIES
 from omen.validation.schema_validator import ValidationResult, Packet
+from omen.validation._constants import (
+    ACT,
+    DECISION,
+    INTEGRITY_ALERT,
+    S3_DECIDE,
+    S5_AUTHORIZE,
+    VERIFY_FIRST,
+)
 
 
 # =============================================================================
@@ -87,10 +96,41 @@ LEGAL_TRANSITIONS: dict[FSMState, set[FSMState]] = {
 }
 
 
+# Per-state legality checks, precompiled from LEGAL_TRANSITIONS at import (so
+# later edits to LEGAL_TRANSITIONS are not picked up). Each entry is a bound
+# frozenset.__contains__, so checking a transition is one C-level call.
+_CAN_TRANSITION: dict[FSMState, Callable[[FSMState], bool]] = {
+    state: frozenset(next_states).__contains__
+    for state, next_states in LEGAL_TRANSITIONS.items()
+}
+
+
 # =============================================================================
 # PACKET TO STATE MAPPING
 # =============================================================================
 
+# States implied by packet type alone. Decision and IntegrityAlert packets
+# depend on their payload and are resolved in packet_implies_state.
+_IMPLIED_STATE_BY_TYPE: dict[PacketType, FSMState] = {
+    PacketType.OBSERVATION: FSMState.S1_SENSE,
+    PacketType.BELIEF_UPDATE: FSMState.S2_MODEL,
+    PacketType.VERIFICATION_PLAN: FSMState.S4_VERIFY,
+    PacketType.TOOL_AUTHORIZATION: FSMState.S5_AUTHORIZE,
+    PacketType.TASK_DIRECTIVE: FSMState.S6_EXECUTE,
+    PacketType.TASK_RESULT: FSMState.S7_REVIEW,
+    PacketType.ESCALATION: FSMState.S8_ESCALATED,
+}
+
+
+# State a Decision outcome moves to after S3_DECIDE (ACT stays in S3_DECIDE)
+_OUTCOME_TO_STATE: dict[DecisionOutcome, FSMState | None] = {
+    DecisionOutcome.VERIFY_FIRST: FSMState.S4_VERIFY,
+    DecisionOutcome.ESCALATE: FSMState.S8_ESCALATED,
+    DecisionOutcome.DEFER: FSMState.S0_IDLE,
+    DecisionOutcome.ACT: None,
+}
+
+
 def packet_implies_state(packet: Packet) -> FSMState | None:
     """
     Determine what FSM state a packet implies we're entering.
@@ -99,41 +139,19 @@ def packet_implies_state(packet: Packet) -> FSMState | None:
     """
     packet_type = packet.header.packet_type
     
-    if packet_type == PacketType.OBSERVATION:
-        return FSMState.S1_SENSE
+    implied_state = _IMPLIED_STATE_BY_TYPE.get(packet_type)
+    if implied_state is not None:
+        return implied_state
     
-    elif packet_type == PacketType.BELIEF_UPDATE:
-        return FSMState.S2_MODEL
-    
-    elif packet_type == PacketType.DECISION:
+    if packet_type is DECISION:
         # Decision outcome determines state
         # (Note: actual validation handles two-phase transition)
-        outcome = packet.payload.decision_outcome
-        if outcome == DecisionOutcome.VERIFY_FIRST:
-            return FSMState.S4_VERIFY
-        elif outcome == DecisionOutcome.ESCALATE:
-            return FSMState.S8_ESCALATED
-        elif outcome == DecisionOutcome.DEFER:
-            return FSMState.S0_IDLE
-        else:  # ACT
+        outcome_state = _OUTCOME_TO_STATE.get(packet.payload.decision_outcome)
+        if outcome_state is None:  # ACT
             return FSMState.S3_DECIDE
+        return outcome_state
     
-    elif packet_type == PacketType.VERIFICATION_PLAN:
-        return FSMState.S4_VERIFY
-    
-    elif packet_type == PacketType.TOOL_AUTHORIZATION:
-        return FSMState.S5_AUTHORIZE
-    
-    elif packet_type == PacketType.TASK_DIRECTIVE:
-        return FSMState.S6_EXECUTE
-    
-    elif packet_type == PacketType.TASK_RESULT:
-        return FSMState.S7_REVIEW
-    
-    elif packet_type == PacketType.ESCALATION:
-        return FSMState.S8_ESCALATED
-    
-    elif packet_type == PacketType.INTEGRITY_ALERT:
+    elif packet_type is INTEGRITY_ALERT:
         # Integrity alerts can trigger safe mode
         if packet.payload.requires_immediate_attention:
             return FSMState.S9_SAFEMODE
@@ -146,7 +164,7 @@ def packet_implies_state(packet: Packet) -> FSMState | None:
 # EPISODE STATE TRACKER
 # =============================================================================
 
-@dataclass
+@dataclass(slots=True)
 class EpisodeState:
     """
     Tracks FSM state for an episode.
@@ -166,10 +184,45 @@ class EpisodeState:
     requires_authorization: bool = False  # WRITE action pending
     pending_decision_id: UUID | None = None  # Decision awaiting verification
     
+    # Whether the episode has ever entered these states (current or history)
+    decide_seen: bool = False
+    authorize_seen: bool = False
+    
     def transition_to(self, new_state: FSMState) -> None:
         """Record state transition."""
         self.state_history.append(self.current_state)
         self.current_state = new_state
+        if new_state is S3_DECIDE:
+            self.decide_seen = True
+        elif new_state is S5_AUTHORIZE:
+            self.authorize_seen = True
+    
+
+def _track_task_directive(episode: EpisodeState) -> None:
+    """Track execution during verification."""
+    if episode.requires_verification:
+        episode.has_executed_since_verify_first = True
+
+
+def _track_belief_update(episode: EpisodeState) -> None:
+    """Clear verification requirement after belief update (if verification was executed)."""
+    if episode.requires_verification and episode.has_executed_since_verify_first:
+        # Verification loop complete: VERIFY_FIRST → EXECUTE → REVIEW → MODEL
+        episode.requires_verification = False
+        episode.has_executed_since_verify_first = False
+
+
+def _track_tool_authorization(episode: EpisodeState) -> None:
+    """Track authorization for WRITE tools."""
+    episode.requires_authorization = False  # Authorized
+
+
+# Per-packet-type episode tracking applied alongside a state transition
+_TRACKING_UPDATES: dict[PacketType, Callable[[EpisodeState], None]] = {
+    PacketType.TASK_DIRECTIVE: _track_task_directive,
+    PacketType.BELIEF_UPDATE: _track_belief_update,
+    PacketType.TOOL_AUTHORIZATION: _track_tool_authorization,
+}
 
 
 # =============================================================================
@@ -191,9 +244,10 @@ class FSMValidator:
     
     def get_or_create_episode(self, episode_id: UUID) -> EpisodeState:
         """Get existing episode state or create new one."""
-        if episode_id not in self._episodes:
-            self._episodes[episode_id] = EpisodeState(episode_id=episode_id)
-        return self._episodes[episode_id]
+        episode = self._episodes.get(episode_id)
+        if episode is None:
+            episode = self._episodes[episode_id] = EpisodeState(episode_id=episode_id)
+        return episode
     
     def validate_transition(self, packet: Packet) -> ValidationResult:
         """
@@ -204,11 +258,12 @@ class FSMValidator:
         errors = []
         warnings = []
         
-        episode_id = packet.header.correlation_id
-        episode = self.get_or_create_episode(episode_id)
+        header = packet.header
+        packet_type = header.packet_type
+        episode = self.get_or_create_episode(header.correlation_id)
         
         # Special handling for Decision packets - they transition through S3_DECIDE
-        if packet.header.packet_type == PacketType.DECISION:
+        if packet_type is DECISION:
             return self._validate_decision_transition(packet, episode)
         
         # Determine implied state
@@ -219,23 +274,32 @@ class FSMValidator:
         
         # Check if transition is legal
         current = episode.current_state
-        legal_next_states = LEGAL_TRANSITIONS.get(current, set())
         
-        if implied_state not in legal_next_states:
+        if not _CAN_TRANSITION[current](implied_state):
             errors.append(
                 f"Illegal FSM transition: {current.value} -> {implied_state.value}"
             )
             return ValidationResult.failure(errors, warnings)
         
         # Additional semantic checks
-        result = self._validate_semantic_constraints(packet, episode)
+        result = self._validate_semantic_constraints(packet, episode, packet_type)
         if not result.valid:
             return result
         
         # Update state
-        self._apply_state_update(packet, episode, implied_state)
+        self._apply_state_update(packet, episode, implied_state, packet_type)
         
-        return ValidationResult(valid=True, errors=[], warnings=warnings)
+        return ValidationResult.build(errors, warnings)
+    
+    def validate_many(self, packets: Iterable[Packet]) -> list[ValidationResult]:
+        """
+        Validate a sequence of packets in order.
+        
+        Equivalent to calling validate_transition on each packet; episode
+        state carries over between packets exactly as it would one by one.
+        """
+        validate_transition = self.validate_transition
+        return [validate_transition(packet) for packet in packets]
     
     def _validate_decision_transition(
         self, packet: Packet, episode: EpisodeState
@@ -250,9 +314,8 @@ class FSMValidator:
         current = episode.current_state
         
         # Phase 1: Validate transition to S3_DECIDE
-        if current != FSMState.S3_DECIDE:
-            legal_next_states = LEGAL_TRANSITIONS.get(current, set())
-            if FSMState.S3_DECIDE not in legal_next_states:
+        if current is not S3_DECIDE:
+            if not _CAN_TRANSITION[current](FSMState.S3_DECIDE):
                 errors.append(
                     f"Illegal FSM transition: {current.value} -> S3_DECIDE"
                 )
@@ -262,24 +325,14 @@ class FSMValidator:
             episode.transition_to(FSMState.S3_DECIDE)
         
         # Phase 2: Determine outcome-based next state
-        outcome = packet.payload.decision_outcome
-        outcome_state = None
-        
-        if outcome == DecisionOutcome.VERIFY_FIRST:
-            outcome_state = FSMState.S4_VERIFY
-        elif outcome == DecisionOutcome.ESCALATE:
-            outcome_state = FSMState.S8_ESCALATED
-        elif outcome == DecisionOutcome.DEFER:
-            outcome_state = FSMState.S0_IDLE
-        # ACT stays in S3_DECIDE
+        outcome_state = _OUTCOME_TO_STATE.get(packet.payload.decision_outcome)
         
         # Apply decision state tracking
         self._apply_decision_state_update(packet, episode, outcome_state)
         
         # If outcome requires state change, validate and apply it
-        if outcome_state and outcome_state != FSMState.S3_DECIDE:
-            legal_from_decide = LEGAL_TRANSITIONS.get(FSMState.S3_DECIDE, set())
-            if outcome_state not in legal_from_decide:
+        if outcome_state is not None and outcome_state is not S3_DECIDE:
+            if not _CAN_TRANSITION[FSMState.S3_DECIDE](outcome_state):
                 errors.append(
                     f"Illegal FSM transition: S3_DECIDE -> {outcome_state.value}"
                 )
@@ -287,10 +340,10 @@ class FSMValidator:
             
             episode.transition_to(outcome_state)
         
-        return ValidationResult(valid=True, errors=[], warnings=warnings)
+        return ValidationResult.build(errors, warnings)
     
     def _validate_semantic_constraints(
-        self, packet: Packet, episode: EpisodeState
+        self, packet: Packet, episode: EpisodeState, packet_type: PacketType
     ) -> ValidationResult:
         """
         Validate semantic constraints beyond simple state transitions.
@@ -298,45 +351,36 @@ class FSMValidator:
         - VERIFY_FIRST must complete verification before ACT
         - WRITE tools require AUTHORIZE state
         """
-        errors = []
-        warnings = []
-        packet_type = packet.header.packet_type
+        errors: list[str] = []
+        warnings: list[str] = []
+        
+        if packet_type is not PacketType.TASK_DIRECTIVE:
+            return ValidationResult.build(errors, warnings)
         
         # Check: Cannot execute without deciding first
-        if packet_type == PacketType.TASK_DIRECTIVE:
-            if FSMState.S3_DECIDE not in episode.state_history and episode.current_state != FSMState.S3_DECIDE:
-                errors.append("Cannot EXECUTE (TaskDirective) without prior DECIDE")
+        if not episode.decide_seen:
+            errors.append("Cannot EXECUTE (TaskDirective) without prior DECIDE")
+        
+        has_write_tools = any(
+            tool.tool_safety in WRITE_SAFETIES
+            for tool in packet.payload.tools
+        )
         
         # Check: VERIFY_FIRST must complete verification before acting
-        if packet_type == PacketType.TASK_DIRECTIVE and episode.requires_verification:
-            # Check if this is a verification task (READ) or action task
-            payload = packet.payload
-            has_write_tools = any(
-                tool.tool_safety in (ToolSafety.WRITE, ToolSafety.MIXED)
-                for tool in payload.tools
+        # (READ tools are verification tasks; WRITE/MIXED are actions)
+        if episode.requires_verification and has_write_tools:
+            errors.append(
+                "VERIFY_FIRST requires verification before WRITE action. "
+                "Complete verification loop first."
             )
-            if has_write_tools:
-                errors.append(
-                    "VERIFY_FIRST requires verification before WRITE action. "
-                    "Complete verification loop first."
-                )
         
         # Check: WRITE/MIXED tools require authorization
-        if packet_type == PacketType.TASK_DIRECTIVE:
-            payload = packet.payload
-            has_write_tools = any(
-                tool.tool_safety in (ToolSafety.WRITE, ToolSafety.MIXED)
-                for tool in payload.tools
+        if has_write_tools and not episode.authorize_seen:
+            errors.append(
+                "WRITE/MIXED tools require AUTHORIZE state before EXECUTE"
             )
-            if has_write_tools:
-                if episode.current_state != FSMState.S5_AUTHORIZE:
-                    # Check if we've been through authorize
-                    if FSMState.S5_AUTHORIZE not in episode.state_history:
-                        errors.append(
-                            "WRITE/MIXED tools require AUTHORIZE state before EXECUTE"
-                        )
         
-        return ValidationResult(valid=len(errors) == 0, errors=errors, warnings=warnings)
+        return ValidationResult.build(errors, warnings)
     
     def _apply_decision_state_update(
         self, packet: Packet, episode: EpisodeState, outcome_state: FSMState | None
@@ -344,41 +388,31 @@ class FSMValidator:
         """Apply decision-specific state tracking."""
         outcome = packet.payload.decision_outcome
         
-        if outcome == DecisionOutcome.VERIFY_FIRST:
+        if outcome is VERIFY_FIRST:
             episode.requires_verification = True
             episode.has_executed_since_verify_first = False
             episode.pending_decision_id = packet.header.packet_id  # Track by packet ID
-        elif outcome == DecisionOutcome.ACT:
+        elif outcome is ACT:
             episode.requires_verification = False
             episode.has_executed_since_verify_first = False
     
     def _apply_state_update(
-        self, packet: Packet, episode: EpisodeState, new_state: FSMState
+        self,
+        packet: Packet,
+        episode: EpisodeState,
+        new_state: FSMState,
+        packet_type: PacketType,
     ) -> None:
         """Apply state transition and update episode tracking."""
-        packet_type = packet.header.packet_type
-        
-        # Track execution during verification
-        if packet_type == PacketType.TASK_DIRECTIVE and episode.requires_verification:
-            episode.has_executed_since_verify_first = True
-        
-        # Clear verification requirement after belief update (if verification was executed)
-        if packet_type == PacketType.BELIEF_UPDATE:
-            if episode.requires_verification and episode.has_executed_since_verify_first:
-                # Verification loop complete: VERIFY_FIRST → EXECUTE → REVIEW → MODEL
-                episode.requires_verification = False
-                episode.has_executed_since_verify_first = False
-        
-        # Track authorization for WRITE tools
-        if packet_type == PacketType.TOOL_AUTHORIZATION:
-            episode.requires_authorization = False  # Authorized
+        track = _TRACKING_UPDATES.get(packet_type)
+        if track is not None:
+            track(episode)
         
         episode.transition_to(new_state)
     
     def reset_episode(self, episode_id: UUID) -> None:
         """Reset episode state (e.g., after completion or error)."""
-        if episode_id in self._episodes:
-            del self._episodes[episode_id]
+        self._episodes.pop(episode_id, None)
     
     def get_current_state(self, episode_id: UUID) -> FSMState:
         """Get current state for an episode."""
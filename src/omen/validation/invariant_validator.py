@@ -12,8 +12,9 @@ Third validation gate. Enforces the 6 invariants from OMEN.md §8.4:
 Spec: OMEN.md §8.4, §15.4
 """
 
+from collections.abc import Callable, Iterable
 from dataclasses import dataclass, field
-from typing import Any
+from typing import Any, cast
 from uuid import UUID
 
 from omen.vocabulary import (
@@ -22,21 +23,43 @@ from omen.vocabulary import (
     StakesLevel,
     EpistemicStatus,
     ToolSafety,
-    DecisionOutcome,
 )
 from omen.validation.schema_validator import ValidationResult, Packet
-from omen.schemas.packets import (
-    DecisionPacket,
-    TaskDirectivePacket,
-    ToolAuthorizationToken,
+from omen.validation._constants import (
+    ACT,
+    DECISION,
+    DERIVED,
+    OBSERVED,
+    SUBPAR,
+    SUPERB,
+    TASK_DIRECTIVE,
 )
+from omen.schemas import MCP, Epistemics, EvidenceRef
+from omen.schemas.packets import DecisionPacket
+
+
+# Packet types that authorize external action
+_ACTION_PACKET_TYPES = frozenset({PacketType.TASK_DIRECTIVE, PacketType.TOOL_AUTHORIZATION})
+
+# Packet types each packet-specific invariant can fire on. Invariants 4 and 5
+# apply to every packet and are not gated.
+_SUBPAR_CHECKED_TYPES = _ACTION_PACKET_TYPES | {PacketType.DECISION}
+_HIGH_STAKES_CHECKED_TYPES = frozenset({PacketType.DECISION, PacketType.TASK_DIRECTIVE})
+
+_ELEVATED_STAKES = frozenset({StakesLevel.HIGH, StakesLevel.CRITICAL})
+_UNGROUNDED_STATUSES = frozenset({EpistemicStatus.INFERRED, EpistemicStatus.HYPOTHESIZED})
 
 
 # =============================================================================
 # EPISODE BUDGET TRACKING
 # =============================================================================
 
-@dataclass
+# BudgetLedger.any_overrun() bits
+OVERRUN_TOKENS = 1
+OVERRUN_TOOL_CALLS = 2
+OVERRUN_TIME = 4
+
+@dataclass(slots=True)
 class BudgetLedger:
     """
     Tracks budget consumption for an episode.
@@ -59,16 +82,36 @@ class BudgetLedger:
     budget_overrun_approved: bool = False
     overrun_approved_by: str | None = None  # Layer that approved
     
-    def is_overrun(self) -> tuple[bool, list[str]]:
-        """Check if any budget is exceeded."""
-        overruns = []
+    def any_overrun(self) -> int:
+        """
+        Return a bitmask of exceeded budgets (0 if none).
+        
+        Bits: OVERRUN_TOKENS, OVERRUN_TOOL_CALLS, OVERRUN_TIME.
+        """
+        mask = 0
         if self.token_budget > 0 and self.tokens_consumed > self.token_budget:
-            overruns.append(f"tokens: {self.tokens_consumed}/{self.token_budget}")
+            mask |= OVERRUN_TOKENS
         if self.tool_call_budget > 0 and self.tool_calls_consumed > self.tool_call_budget:
-            overruns.append(f"tool_calls: {self.tool_calls_consumed}/{self.tool_call_budget}")
+            mask |= OVERRUN_TOOL_CALLS
         if self.time_budget_seconds > 0 and self.time_elapsed_seconds > self.time_budget_seconds:
-            overruns.append(f"time: {self.time_elapsed_seconds}s/{self.time_budget_seconds}s")
-        return len(overruns) > 0, overruns
+            mask |= OVERRUN_TIME
+        return mask
+    
+    def overrun_details(self, mask: int) -> list[str]:
+        """Format one detail string per budget set in mask."""
+        details = []
+        if mask & OVERRUN_TOKENS:
+            details.append(f"tokens: {self.tokens_consumed}/{self.token_budget}")
+        if mask & OVERRUN_TOOL_CALLS:
+            details.append(f"tool_calls: {self.tool_calls_consumed}/{self.tool_call_budget}")
+        if mask & OVERRUN_TIME:
+            details.append(f"time: {self.time_elapsed_seconds}s/{self.time_budget_seconds}s")
+        return details
+    
+    def is_overrun(self) -> tuple[bool, list[str]]:
+        """Check if any budget is exceeded."""
+        mask = self.any_overrun()
+        return mask != 0, self.overrun_details(mask)
 
 
 # =============================================================================
@@ -87,12 +130,15 @@ class InvariantValidator:
     
     def __init__(self):
         self._budget_ledgers: dict[UUID, BudgetLedger] = {}
+        # Validators specialized per packet type, built on first sight
+        self._specialized: dict[PacketType, Callable[[Packet], ValidationResult]] = {}
     
     def get_or_create_ledger(self, episode_id: UUID) -> BudgetLedger:
         """Get existing budget ledger or create new one."""
-        if episode_id not in self._budget_ledgers:
-            self._budget_ledgers[episode_id] = BudgetLedger(episode_id=episode_id)
-        return self._budget_ledgers[episode_id]
+        ledger = self._budget_ledgers.get(episode_id)
+        if ledger is None:
+            ledger = self._budget_ledgers[episode_id] = BudgetLedger(episode_id=episode_id)
+        return ledger
     
     def validate(self, packet: Packet) -> ValidationResult:
         """
@@ -106,23 +152,82 @@ class InvariantValidator:
         - Invariant 5: Budget overruns require approval
         - Invariant 6 (drive arbitration) enforced by layer contracts, not packet validation
         """
-        result = ValidationResult.success()
-        
-        # Invariant 2: SUBPAR never authorizes external action
-        result = result.merge(self._check_subpar_no_action(packet))
-        
-        # Invariant 3: HIGH/CRITICAL require verification or escalation
-        result = result.merge(self._check_high_stakes_verification(packet))
+        packet_type = packet.header.packet_type
+        validate_packet = self._specialized.get(packet_type)
+        if validate_packet is None:
+            validate_packet = self._specialize(packet_type)
+            self._specialized[packet_type] = validate_packet
+        return validate_packet(packet)
+    
+    def _specialize(self, packet_type: PacketType) -> Callable[[Packet], ValidationResult]:
+        """
+        Build a validate function for one packet type.
         
-        # Invariant 4: No live truth without tool evidence
-        result = result.merge(self._check_live_truth_grounding(packet))
+        Invariants 2 and 3 can only fire for some packet types; the returned
+        closure carries only the checks that apply, with the check methods
+        pre-bound as locals.
+        """
+        check_live_truth = self._check_live_truth_grounding
+        check_budget = self._check_budget_approval
+        
+        if packet_type not in _SUBPAR_CHECKED_TYPES | _HIGH_STAKES_CHECKED_TYPES:
+            # Invariants 4 and 5 only
+            def validate_packet(packet: Packet) -> ValidationResult:
+                mcp = packet.mcp
+                result = check_live_truth(mcp.epistemics, mcp.evidence.evidence_refs)
+                return result.merge(check_budget(packet, mcp, mcp.stakes.stakes_level))
+            
+            return validate_packet
+        
+        check_subpar = (
+            self._check_subpar_no_action if packet_type in _SUBPAR_CHECKED_TYPES else None
+        )
+        check_high_stakes = (
+            self._check_high_stakes_verification
+            if packet_type in _HIGH_STAKES_CHECKED_TYPES
+            else None
+        )
+        
+        def validate_with_gated_checks(packet: Packet) -> ValidationResult:
+            # Hoist MCP attribute chains once; checks below work on locals
+            mcp = packet.mcp
+            stakes_level = mcp.stakes.stakes_level
+            tier = mcp.quality.quality_tier
+            evidence_refs = mcp.evidence.evidence_refs
+            
+            result = ValidationResult.success()
+            
+            # Invariant 2: SUBPAR never authorizes external action
+            if check_subpar is not None and tier is SUBPAR:
+                result = result.merge(check_subpar(packet, packet_type, tier))
+            
+            # Invariant 3: HIGH/CRITICAL require verification or escalation
+            if check_high_stakes is not None and stakes_level in _ELEVATED_STAKES:
+                result = result.merge(
+                    check_high_stakes(packet, packet_type, stakes_level, tier, evidence_refs)
+                )
+            
+            # Invariant 4: No live truth without tool evidence
+            result = result.merge(check_live_truth(mcp.epistemics, evidence_refs))
+            
+            # Invariant 5: Budget overruns require approval
+            return result.merge(check_budget(packet, mcp, stakes_level))
         
-        # Invariant 5: Budget overruns require approval
-        result = result.merge(self._check_budget_approval(packet))
+        return validate_with_gated_checks
+    
+    def validate_many(self, packets: Iterable[Packet]) -> list[ValidationResult]:
+        """
+        Validate invariants for a sequence of packets in order.
         
-        return result
+        Equivalent to calling validate on each packet; budget ledgers are
+        updated as they would be one by one.
+        """
+        validate = self.validate
+        return [validate(packet) for packet in packets]
     
-    def _check_subpar_no_action(self, packet: Packet) -> ValidationResult:
+    def _check_subpar_no_action(
+        self, packet: Packet, packet_type: PacketType, tier: QualityTier
+    ) -> ValidationResult:
         """
         Invariant 2: SUBPAR outputs MUST NOT authorize external action.
         
@@ -131,33 +236,37 @@ class InvariantValidator:
         
         Spec: OMEN.md §8.4 bullet 2, §8.2.2
         """
-        errors = []
-        warnings = []
+        errors: list[str] = []
+        warnings: list[str] = []
+        
+        if tier is not SUBPAR:
+            return ValidationResult.build(errors, warnings)
         
         # Check if this is an action-authorizing packet
-        is_action_packet = isinstance(packet, (TaskDirectivePacket, ToolAuthorizationToken))
+        if packet_type in _ACTION_PACKET_TYPES:
+            errors.append(
+                "SUBPAR quality tier cannot authorize external action. "
+                "Upgrade to PAR or SUPERB."
+            )
         
-        if is_action_packet:
-            tier = packet.mcp.quality.quality_tier
-            if tier == QualityTier.SUBPAR:
+        # Also check Decision packets with ACT outcome
+        elif packet_type is DECISION:
+            if cast(DecisionPacket, packet).payload.decision_outcome is ACT:
                 errors.append(
-                    "SUBPAR quality tier cannot authorize external action. "
-                    "Upgrade to PAR or SUPERB."
+                    "SUBPAR quality tier cannot issue ACT decision. "
+                    "Use VERIFY_FIRST, ESCALATE, or DEFER instead."
                 )
         
-        # Also check Decision packets with ACT outcome
-        if isinstance(packet, DecisionPacket):
-            if packet.payload.decision_outcome == DecisionOutcome.ACT:
-                tier = packet.mcp.quality.quality_tier
-                if tier == QualityTier.SUBPAR:
-                    errors.append(
-                        "SUBPAR quality tier cannot issue ACT decision. "
-                        "Use VERIFY_FIRST, ESCALATE, or DEFER instead."
-                    )
-        
-        return ValidationResult(valid=len(errors) == 0, errors=errors, warnings=warnings)
+        return ValidationResult.build(errors, warnings)
     
-    def _check_high_stakes_verification(self, packet: Packet) -> ValidationResult:
+    def _check_high_stakes_verification(
+        self,
+        packet: Packet,
+        packet_type: PacketType,
+        stakes_level: StakesLevel,
+        tier: QualityTier,
+        evidence_refs: list[EvidenceRef],
+    ) -> ValidationResult:
         """
         Invariant 3: HIGH/CRITICAL require verification loops or escalation/refusal.
         
@@ -166,44 +275,43 @@ class InvariantValidator:
         
         Spec: OMEN.md §8.4 bullet 3, §8.2.2
         """
-        errors = []
-        warnings = []
-        
-        stakes_level = packet.mcp.stakes.stakes_level
+        errors: list[str] = []
+        warnings: list[str] = []
         
         # Only applies to Decision packets with ACT outcome
-        if isinstance(packet, DecisionPacket):
-            outcome = packet.payload.decision_outcome
+        if packet_type is DECISION:
+            outcome = cast(DecisionPacket, packet).payload.decision_outcome
             
-            if stakes_level in (StakesLevel.HIGH, StakesLevel.CRITICAL):
-                if outcome == DecisionOutcome.ACT:
+            if stakes_level in _ELEVATED_STAKES:
+                if outcome is ACT:
                     # ACT at HIGH/CRITICAL requires SUPERB tier
-                    tier = packet.mcp.quality.quality_tier
-                    if tier != QualityTier.SUPERB:
+                    if tier is not SUPERB:
                         errors.append(
                             f"HIGH/CRITICAL stakes with ACT outcome requires SUPERB tier, "
                             f"got {tier.value}. Use VERIFY_FIRST or ESCALATE instead."
                         )
                     
                     # Should have evidence refs (verification completed)
-                    if not packet.mcp.evidence.evidence_refs:
+                    if not evidence_refs:
                         warnings.append(
                             "HIGH/CRITICAL ACT decision has no evidence refs. "
                             "Verify load-bearing assumptions were checked."
                         )
         
         # Task directives at HIGH/CRITICAL should have strong evidence
-        if isinstance(packet, TaskDirectivePacket):
-            if stakes_level in (StakesLevel.HIGH, StakesLevel.CRITICAL):
-                if not packet.mcp.evidence.evidence_refs:
+        elif packet_type is TASK_DIRECTIVE:
+            if stakes_level in _ELEVATED_STAKES:
+                if not evidence_refs:
                     warnings.append(
                         "HIGH/CRITICAL TaskDirective has no evidence refs. "
                         "Ensure verification was completed."
                     )
         
-        return ValidationResult(valid=len(errors) == 0, errors=errors, warnings=warnings)
+        return ValidationResult.build(errors, warnings)
     
-    def _check_live_truth_grounding(self, packet: Packet) -> ValidationResult:
+    def _check_live_truth_grounding(
+        self, epistemics: Epistemics, evidence_refs: list[EvidenceRef]
+    ) -> ValidationResult:
         """
         Invariant 4: LLM cannot claim live truth without tool evidence refs.
         
@@ -212,39 +320,41 @@ class InvariantValidator:
         
         Spec: OMEN.md §8.4 bullet 4, §8.1
         """
-        errors = []
-        warnings = []
+        errors: list[str] = []
+        warnings: list[str] = []
         
-        epistemics = packet.mcp.epistemics
-        evidence = packet.mcp.evidence
+        status = epistemics.status
+        confidence = epistemics.confidence
         
         # OBSERVED status requires evidence refs
-        if epistemics.status == EpistemicStatus.OBSERVED:
-            if not evidence.evidence_refs:
+        if status is OBSERVED:
+            if not evidence_refs:
                 errors.append(
                     "OBSERVED epistemic status requires tool/sensor evidence refs. "
                     "Use INFERRED or HYPOTHESIZED if no direct observation."
                 )
         
         # High confidence DERIVED should reference inputs
-        if epistemics.status == EpistemicStatus.DERIVED:
-            if epistemics.confidence > 0.9 and not evidence.evidence_refs:
+        if status is DERIVED:
+            if confidence > 0.9 and not evidence_refs:
                 warnings.append(
                     "High confidence DERIVED claim has no evidence refs. "
                     "Consider adding refs to input observations."
                 )
         
         # INFERRED/HYPOTHESIZED with high confidence is suspicious
-        if epistemics.status in (EpistemicStatus.INFERRED, EpistemicStatus.HYPOTHESIZED):
-            if epistemics.confidence > 0.8:
+        if status in _UNGROUNDED_STATUSES:
+            if confidence > 0.8:
                 warnings.append(
-                    f"{epistemics.status.value} with confidence {epistemics.confidence} "
+                    f"{status.value} with confidence {confidence} "
                     "may be overconfident. Consider verification or lower confidence."
                 )
         
-        return ValidationResult(valid=len(errors) == 0, errors=errors, warnings=warnings)
+        return ValidationResult.build(errors, warnings)
     
-    def _check_budget_approval(self, packet: Packet) -> ValidationResult:
+    def _check_budget_approval(
+        self, packet: Packet, mcp: MCP, stakes_level: StakesLevel
+    ) -> ValidationResult:
         """
         Invariant 5: Budget overruns require explicit approval.
         
@@ -252,25 +362,29 @@ class InvariantValidator:
         
         Spec: OMEN.md §8.4 bullet 5, §8.2.4
         """
-        errors = []
-        warnings = []
+        errors: list[str] = []
+        warnings: list[str] = []
         
         episode_id = packet.header.correlation_id
         ledger = self.get_or_create_ledger(episode_id)
         
         # Update budgets from first directive we see
         if ledger.token_budget == 0:
-            ledger.token_budget = packet.mcp.budgets.token_budget
-            ledger.tool_call_budget = packet.mcp.budgets.tool_call_budget
-            ledger.time_budget_seconds = packet.mcp.budgets.time_budget_seconds
+            budgets = mcp.budgets
+            ledger.token_budget = budgets.token_budget
+            ledger.tool_call_budget = budgets.tool_call_budget
+            ledger.time_budget_seconds = budgets.time_budget_seconds
         
-        # Check for overruns
-        is_overrun, overrun_details = ledger.is_overrun()
+        # Approved overruns are never reported, so don't format details for them
+        if ledger.budget_overrun_approved:
+            return ValidationResult.build(errors, warnings)
         
-        if is_overrun and not ledger.budget_overrun_approved:
-            stakes_level = packet.mcp.stakes.stakes_level
-            
-            if stakes_level in (StakesLevel.HIGH, StakesLevel.CRITICAL):
+        # Check for overruns; details are only formatted when reported
+        overrun_mask = ledger.any_overrun()
+        
+        if overrun_mask:
+            overrun_details = ledger.overrun_details(overrun_mask)
+            if stakes_level in _ELEVATED_STAKES:
                 errors.append(
                     f"Budget overrun at {stakes_level.value} stakes requires Layer 1 approval. "
                     f"Overruns: {', '.join(overrun_details)}"
@@ -281,7 +395,7 @@ class InvariantValidator:
                     "Consider escalation or scope reduction."
                 )
         
-        return ValidationResult(valid=len(errors) == 0, errors=errors, warnings=warnings)
+        return ValidationResult.build(errors, warnings)
     
     def update_budget_consumption(
         self,
@@ -308,8 +422,7 @@ class InvariantValidator:
     
     def reset_episode(self, episode_id: UUID) -> None:
         """Reset budget ledger for an episode."""
-        if episode_id in self._budget_ledgers:
-            del self._budget_ledgers[episode_id]
+        self._budget_ledgers.pop(episode_id, None)
 
 
 # Convenience function
@@ -1,20 +1,22 @@
 """
 Schema Validator — Structural correctness for packets.
 
-First validation gate. Ensures:
-- All required MCP fields present
-- Enum values valid
-- Evidence completeness (refs OR absent_reason)
-- Budget values non-negative
-- Confidence in bounds
+First validation gate. Pydantic packet construction already enforces
+required fields, UUID headers, enum values, evidence completeness (refs OR
+absent_reason), non-negative budgets and confidence bounds. This layer adds
+the semantic checks Pydantic can't express:
+- Non-empty intent summary
+- Suspicious-but-legal MCP values (zero budgets, confidence of 1.0)
+- Payload-specific rules
 
 Spec: OMEN.md §9.2, §15.4
 """
 
-from dataclasses import dataclass
-from typing import Any
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass, field
+from typing import Any, get_args
 
-from omen.schemas import MCP, PacketHeader
+from omen.schemas import MCP
 from omen.schemas.packets import (
     ObservationPacket,
     BeliefUpdatePacket,
@@ -26,7 +28,7 @@ from omen.schemas.packets import (
     EscalationPacket,
     IntegrityAlertPacket,
 )
-from omen.vocabulary import PacketType, QualityTier, DecisionOutcome, TaskResultStatus
+from omen.vocabulary import QualityTier, DecisionOutcome, TaskResultStatus
 
 
 # Type alias for any packet
@@ -43,23 +45,37 @@ Packet = (
 )
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class ValidationResult:
-    """Result of a validation check."""
+    """Result of a validation check (immutable)."""
     valid: bool
-    errors: list[str]
-    warnings: list[str]
+    errors: tuple[str, ...]
+    warnings: tuple[str, ...]
     
     @classmethod
     def success(cls) -> "ValidationResult":
-        return cls(valid=True, errors=[], warnings=[])
+        """Return the shared clean result; results are immutable."""
+        return _SUCCESS
     
     @classmethod
-    def failure(cls, errors: list[str], warnings: list[str] | None = None) -> "ValidationResult":
-        return cls(valid=False, errors=errors, warnings=warnings or [])
+    def failure(
+        cls, errors: Iterable[str], warnings: Iterable[str] | None = None
+    ) -> "ValidationResult":
+        return cls(valid=False, errors=tuple(errors), warnings=tuple(warnings or ()))
+    
+    @classmethod
+    def build(cls, errors: list[str], warnings: list[str]) -> "ValidationResult":
+        """Build a result from collected findings; valid iff no errors."""
+        if not errors and not warnings:
+            return _SUCCESS
+        return cls(valid=not errors, errors=tuple(errors), warnings=tuple(warnings))
     
     def merge(self, other: "ValidationResult") -> "ValidationResult":
         """Combine two results."""
+        if other is _SUCCESS:
+            return self
+        if self is _SUCCESS:
+            return other
         return ValidationResult(
             valid=self.valid and other.valid,
             errors=self.errors + other.errors,
@@ -67,6 +83,24 @@ class ValidationResult:
         )
 
 
+# Shared result for clean packets
+_SUCCESS = ValidationResult(valid=True, errors=(), warnings=())
+
+
+@dataclass(slots=True)
+class _ValidationAccumulator:
+    """Collects errors and warnings across the checks of one validation pass."""
+    errors: list[str] = field(default_factory=list)
+    warnings: list[str] = field(default_factory=list)
+    
+    def to_result(self) -> ValidationResult:
+        return ValidationResult.build(self.errors, self.warnings)
+
+
+# Payload validator signature: (validator, packet, accumulator) -> None
+_PayloadHandler = Callable[["SchemaValidator", Any, _ValidationAccumulator], None]
+
+
 class SchemaValidator:
     """
     Validates packet structural correctness.
@@ -77,101 +111,109 @@ class SchemaValidator:
     Spec: OMEN.md §15.4 bullet 1
     """
     
+    def __init__(self) -> None:
+        # One validate function per packet class, with the header, MCP and
+        # payload steps pre-bound so a call skips all per-packet dispatch
+        self._validators: dict[type[Packet], Callable[[Packet], ValidationResult]] = {
+            packet_class: self._specialize(packet_class)
+            for packet_class in get_args(Packet)
+        }
+    
     def validate(self, packet: Packet) -> ValidationResult:
         """
         Validate a packet's structure.
         
         Checks:
-        1. Header completeness
-        2. MCP completeness  
-        3. Evidence completeness
-        4. Payload-specific rules
-        """
-        result = ValidationResult.success()
-        
-        # Header validation
-        result = result.merge(self._validate_header(packet.header))
-        
-        # MCP validation
-        result = result.merge(self._validate_mcp(packet.mcp))
+        1. MCP semantic completeness
+        2. Payload-specific rules
         
-        # Payload-specific validation
-        result = result.merge(self._validate_payload(packet))
-        
-        return result
+        Header and evidence completeness are enforced by Pydantic at
+        packet construction.
+        """
+        validate_packet = self._validators.get(type(packet))
+        if validate_packet is None:
+            validate_packet = self._specialize(type(packet))
+            self._validators[type(packet)] = validate_packet
+        return validate_packet(packet)
     
-    def _validate_header(self, header: PacketHeader) -> ValidationResult:
-        """Validate packet header."""
-        errors = []
-        warnings = []
-        
-        # packet_id is required and must be non-empty
-        if not header.packet_id:
-            errors.append("Header missing packet_id")
-        
-        # packet_type must be valid enum
-        if header.packet_type not in PacketType:
-            errors.append(f"Invalid packet_type: {header.packet_type}")
-        
-        # correlation_id is required for episode tracking
-        if not header.correlation_id:
-            errors.append("Header missing correlation_id")
+    def validate_many(self, packets: Iterable[Packet]) -> list[ValidationResult]:
+        """Validate a sequence of packets, returning results in input order."""
+        validators = self._validators
+        validate = self.validate
+        results = []
+        for packet in packets:
+            validate_packet = validators.get(type(packet))
+            results.append(
+                validate_packet(packet) if validate_packet is not None else validate(packet)
+            )
+        return results
+    
+    def _specialize(
+        self, packet_class: type[Packet]
+    ) -> Callable[[Packet], ValidationResult]:
+        """Build the validate function for one packet class."""
+        validate_mcp = self._validate_mcp
+        # Dispatch is keyed by exact type(); resolve a subclass to its nearest
+        # registered base here, once, so it keeps the base's payload rules.
+        payload_handler = next(
+            (
+                _PAYLOAD_DISPATCH[base]
+                for base in packet_class.__mro__
+                if base in _PAYLOAD_DISPATCH
+            ),
+            None,
+        )
         
-        return ValidationResult(valid=len(errors) == 0, errors=errors, warnings=warnings)
+        if payload_handler is None:
+            # Other packets have payload validation in Pydantic models
+            def validate_packet(packet: Packet) -> ValidationResult:
+                acc = _ValidationAccumulator()
+                validate_mcp(packet.mcp, acc)
+                return acc.to_result()
+            
+            return validate_packet
+        
+        def validate_with_payload(packet: Packet) -> ValidationResult:
+            acc = _ValidationAccumulator()
+            validate_mcp(packet.mcp, acc)
+            payload_handler(self, packet, acc)
+            return acc.to_result()
+        
+        return validate_with_payload
     
-    def _validate_mcp(self, mcp: MCP) -> ValidationResult:
+    def _validate_mcp(self, mcp: MCP, acc: _ValidationAccumulator) -> None:
         """
         Validate MCP envelope completeness.
         
         Spec: OMEN.md §9.2, §15.4 bullet 1
         """
-        errors = []
-        warnings = []
+        warnings = acc.warnings
+        budgets = mcp.budgets
+        confidence = mcp.epistemics.confidence
         
         # Intent validation
         if not mcp.intent.summary:
-            errors.append("MCP intent.summary is empty")
-        
-        # Stakes validation  
-        # (enum validation handled by Pydantic, but we verify stakes_level is set)
-        if not mcp.stakes.stakes_level:
-            errors.append("MCP stakes.stakes_level is missing")
+            acc.errors.append("MCP intent.summary is empty")
         
         # Quality validation
         if not mcp.quality.definition_of_done.text:
             warnings.append("MCP quality.definition_of_done.text is empty")
         
         # Budgets validation (non-negative handled by Pydantic)
-        if mcp.budgets.token_budget == 0 and mcp.budgets.tool_call_budget == 0:
+        if budgets.token_budget == 0 and budgets.tool_call_budget == 0:
             warnings.append("Both token_budget and tool_call_budget are 0")
         
-        # Epistemics validation
-        if mcp.epistemics.confidence < 0 or mcp.epistemics.confidence > 1:
-            errors.append(f"MCP epistemics.confidence out of bounds: {mcp.epistemics.confidence}")
-        
+        # Epistemics validation (bounds handled by Pydantic)
         # Warn on confidence of 1.0 (epistemically suspicious per §8.1)
-        if mcp.epistemics.confidence == 1.0:
+        if confidence == 1.0:
             warnings.append("Confidence of 1.0 is rarely justified")
         
         # Evidence validation — rely on Pydantic MCP.validate_evidence_completeness
         # If packet construction succeeded, evidence XOR is already satisfied
-        
-        return ValidationResult(valid=len(errors) == 0, errors=errors, warnings=warnings)
-    
-    def _validate_payload(self, packet: Packet) -> ValidationResult:
-        """Validate payload-specific rules."""
-        if isinstance(packet, DecisionPacket):
-            return self._validate_decision_payload(packet)
-        elif isinstance(packet, TaskResultPacket):
-            return self._validate_task_result_payload(packet)
-        elif isinstance(packet, ToolAuthorizationToken):
-            return self._validate_token_payload(packet)
-        elif isinstance(packet, EscalationPacket):
-            return self._validate_escalation_payload(packet)
-        # Other packets have validation in Pydantic models
-        return ValidationResult.success()
     
-    def _validate_decision_payload(self, packet: DecisionPacket) -> ValidationResult:
+    def _validate_decision_payload(
+        self, packet: DecisionPacket, acc: _ValidationAccumulator
+    ) -> None:
         """
         Validate DecisionPacket payload rules.
         
@@ -181,18 +223,16 @@ class SchemaValidator:
         Pydantic validators in DecisionPacket. This method handles additional
         semantic checks that Pydantic can't catch.
         """
-        errors = []
-        warnings = []
         payload = packet.payload
         
         # Load-bearing assumptions should be flagged
         if payload.load_bearing_assumptions:
             if not payload.assumptions:
-                warnings.append("load_bearing_assumptions set but assumptions list is empty")
-        
-        return ValidationResult(valid=len(errors) == 0, errors=errors, warnings=warnings)
+                acc.warnings.append("load_bearing_assumptions set but assumptions list is empty")
     
-    def _validate_task_result_payload(self, packet: TaskResultPacket) -> ValidationResult:
+    def _validate_task_result_payload(
+        self, packet: TaskResultPacket, acc: _ValidationAccumulator
+    ) -> None:
         """
         Validate TaskResultPacket payload rules.
         
@@ -201,53 +241,46 @@ class SchemaValidator:
         Note: FAILURE status requirements are already enforced by Pydantic
         validators. This method handles additional semantic checks.
         """
-        errors = []
-        warnings = []
         payload = packet.payload
         
         # SUCCESS with no output is unusual
-        if payload.status == TaskResultStatus.SUCCESS:
+        if payload.status is TaskResultStatus.SUCCESS:
             if payload.output is None:
-                warnings.append("SUCCESS result has no output")
-        
-        return ValidationResult(valid=len(errors) == 0, errors=errors, warnings=warnings)
-    
-    def _validate_token_payload(self, packet: ToolAuthorizationToken) -> ValidationResult:
-        """
-        Validate ToolAuthorizationToken payload rules.
-        
-        Spec: OMEN.md §10.4
-        
-        Note: Revoked token and scope requirements are already enforced by
-        Pydantic validators. This method handles additional semantic checks.
-        """
-        errors = []
-        warnings = []
-        # All critical validations handled by Pydantic
-        return ValidationResult(valid=len(errors) == 0, errors=errors, warnings=warnings)
+                acc.warnings.append("SUCCESS result has no output")
     
-    def _validate_escalation_payload(self, packet: EscalationPacket) -> ValidationResult:
+    def _validate_escalation_payload(
+        self, packet: EscalationPacket, acc: _ValidationAccumulator
+    ) -> None:
         """
         Validate EscalationPacket payload rules.
         
         Spec: OMEN.md §8.2.6
         """
-        errors = []
-        warnings = []
         payload = packet.payload
         
         # Must have at least one option
         if not payload.options:
-            errors.append("Escalation must present at least one option")
+            acc.errors.append("Escalation must present at least one option")
         
         # Should have evidence of what's known vs believed
         if not payload.what_we_know and not payload.what_we_believe:
-            warnings.append("Escalation has neither what_we_know nor what_we_believe")
-        
-        return ValidationResult(valid=len(errors) == 0, errors=errors, warnings=warnings)
+            acc.warnings.append("Escalation has neither what_we_know nor what_we_believe")
+
+
+# Payload validators keyed by exact packet class. ToolAuthorizationToken
+# has none: revoked-token and scope rules are enforced by Pydantic (§10.4).
+_PAYLOAD_DISPATCH: dict[type[Packet], _PayloadHandler] = {
+    DecisionPacket: SchemaValidator._validate_decision_payload,
+    TaskResultPacket: SchemaValidator._validate_task_result_payload,
+    EscalationPacket: SchemaValidator._validate_escalation_payload,
+}
+
+
+# SchemaValidator holds no state, so one shared instance serves every call
+_DEFAULT_VALIDATOR = SchemaValidator()
 
 
 # Convenience function
 def validate_schema(packet: Packet) -> ValidationResult:
     """Validate a packet's structural correctness."""
-    return SchemaValidator().validate(packet)
+    return _DEFAULT_VALIDATOR.validate(packet)
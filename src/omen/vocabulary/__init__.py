@@ -21,6 +21,7 @@ from omen.vocabulary.enums import (
     TaskClass,
     ToolsState,
     ToolSafety,
+    WRITE_SAFETIES,
     # Packets
     PacketType,
     LayerSource,
@@ -51,6 +52,7 @@ __all__ = [
     "TaskClass",
     "ToolsState",
     "ToolSafety",
+    "WRITE_SAFETIES",
     # Packets
     "PacketType",
     "LayerSource",
@@ -179,6 +179,10 @@ class ToolSafety(str, Enum):
     MIXED = "MIXED"
 
 
+# Tool safety classes that require an authorization token
+WRITE_SAFETIES = frozenset({ToolSafety.WRITE, ToolSafety.MIXED})
+
+
 # =============================================================================
 # PACKET MODEL — OMEN.md §9
 # =============================================================================
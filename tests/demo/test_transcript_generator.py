@@ -151,6 +151,60 @@ def test_transcript_generation(generator: CognitiveTranscriptGenerator, mock_epi
     assert "COGNITIVE EPISODE TRANSCRIPT" in transcript
 
 
+def test_in_place_capture_edit_is_rendered(generator: CognitiveTranscriptGenerator, mock_episode_result: EpisodeResult):
+    """Steps appended to the capture after a render show up in the next one."""
+    generator.from_episode_result(mock_episode_result)
+    generator.generate_transcript()
+    
+    generator.capture.steps.append(StepCapture(
+        step_id="late_step",
+        layer=LayerSource.LAYER_5,
+        fsm_state="S7_REVIEW",
+        duration_seconds=0.1,
+        system_prompt="",
+        context_summary={},
+    ))
+    
+    assert "late_step" in generator.generate_transcript()
+
+
+def test_new_capture_renders_new_episode(generator: CognitiveTranscriptGenerator, mock_episode_result: EpisodeResult):
+    """Capturing another episode renders that episode, not the cached one."""
+    generator.from_episode_result(mock_episode_result)
+    generator.generate_transcript()
+    
+    other = EpisodeResult(
+        correlation_id=uuid4(),
+        template_id="TEMPLATE_B",
+        success=False,
+        ledger_summary={},
+    )
+    generator.from_episode_result(other)
+    
+    transcript = generator.generate_transcript()
+    assert "TEMPLATE_B" in transcript
+    assert str(other.correlation_id) in transcript
+
+
+def test_assigning_capture_renders_it(generator: CognitiveTranscriptGenerator, mock_episode_result: EpisodeResult):
+    """Setting the capture attribute directly renders that capture."""
+    generator.from_episode_result(mock_episode_result)
+    first = generator.generate_transcript()
+    
+    other_generator = CognitiveTranscriptGenerator()
+    other_generator.from_episode_result(EpisodeResult(
+        correlation_id=uuid4(),
+        template_id="TEMPLATE_B",
+        success=False,
+        ledger_summary={},
+    ))
+    generator.capture = other_generator.capture
+    
+    transcript = generator.generate_transcript()
+    assert transcript != first
+    assert transcript == other_generator.generate_transcript()
+
+
 def test_transcript_includes_all_sections(generator: CognitiveTranscriptGenerator, mock_episode_result: EpisodeResult):
     """Generated transcript has all required sections."""
     generator.from_episode_result(mock_episode_result)
@@ -241,6 +295,59 @@ def test_save_creates_parent_directories(generator: CognitiveTranscriptGenerator
         assert filepath.exists()
 
 
+def test_save_matches_generated_transcript(generator: CognitiveTranscriptGenerator, mock_episode_result: EpisodeResult):
+    """Streamed file content is identical to the in-memory transcript."""
+    generator.from_episode_result(mock_episode_result)
+    
+    with tempfile.TemporaryDirectory() as tmpdir:
+        filepath = Path(tmpdir) / "transcript.txt"
+        generator.save(filepath)
+        
+        assert filepath.read_text(encoding="utf-8") == generator.generate_transcript()
+
+
+def test_save_writes_given_transcript(generator: CognitiveTranscriptGenerator, mock_episode_result: EpisodeResult):
+    """A transcript handed to save is written as-is."""
+    generator.from_episode_result(mock_episode_result)
+    transcript = generator.generate_transcript()
+    
+    with tempfile.TemporaryDirectory() as tmpdir:
+        filepath = Path(tmpdir) / "transcript.txt"
+        generator.save(filepath, transcript)
+        
+        assert filepath.read_text(encoding="utf-8") == transcript
+
+
+def test_save_without_capture_writes_nothing(generator: CognitiveTranscriptGenerator):
+    """Save raises before creating the file when nothing was captured."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        filepath = Path(tmpdir) / "transcript.txt"
+        with pytest.raises(ValueError, match="No episode captured"):
+            generator.save(filepath)
+        
+        assert not filepath.exists()
+
+
+def test_failed_save_keeps_previous_file(generator: CognitiveTranscriptGenerator, mock_episode_result: EpisodeResult, monkeypatch: pytest.MonkeyPatch):
+    """A section that fails mid-save leaves the existing file intact."""
+    generator.from_episode_result(mock_episode_result)
+    
+    def fail() -> str:
+        raise RuntimeError("section failed")
+    
+    monkeypatch.setattr(generator, "_generate_budget_timeline", fail)
+    
+    with tempfile.TemporaryDirectory() as tmpdir:
+        filepath = Path(tmpdir) / "transcript.txt"
+        filepath.write_text("previous transcript", encoding="utf-8")
+        
+        with pytest.raises(RuntimeError, match="section failed"):
+            generator.save(filepath)
+        
+        assert filepath.read_text(encoding="utf-8") == "previous transcript"
+        assert list(Path(tmpdir).iterdir()) == [filepath]
+
+
 # =============================================================================
 # FORMATTING UTILITIES TESTS
 # =============================================================================
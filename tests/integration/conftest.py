@@ -3,7 +3,17 @@ Integration test configuration.
 
 These tests call real APIs and cost money.
 Run with: pytest -m integration
+Run in parallel: pytest -m integration -n auto --dist loadgroup
 Skip with: pytest -m "not integration"
+
+Tests are dominated by LLM latency, so xdist workers overlap episodes
+(within API rate limits). Wall time is bounded by the longest chain a
+single worker must run. loadgroup hands out tests one at a time, except
+those sharing an xdist_group mark, which stay on one worker. Template A
+uses a group so its class-scoped episode runs once. Avoid loadscope and
+loadfile here: they pin each class or module to one worker, so the
+parametrized template cases would run one after another. The
+session-scoped client is created once per worker, which is cheap.
 """
 
 import os
@@ -18,6 +28,11 @@ def pytest_configure(config):
     config.addinivalue_line(
         "markers", "integration: marks tests as integration tests (may incur API costs)"
     )
+    # Registered by pytest-xdist when installed; declared here so the mark
+    # is known without it
+    config.addinivalue_line(
+        "markers", "xdist_group(name): run tests sharing the group on one xdist worker"
+    )
 
 
 @pytest.fixture(scope="session")
@@ -47,16 +62,19 @@ def integration_orchestrator(openai_client):
 def response_log(tmp_path):
     """Log raw responses to file for offline analysis."""
     log_file = tmp_path / "responses.jsonl"
+    # Opened once per test; line buffering keeps each entry on disk as soon
+    # as it is logged, so the file is complete even if the test fails
+    f = open(log_file, "a", buffering=1)
     
     def log(layer: str, response: str, context: dict | None = None):
-        with open(log_file, "a") as f:
-            entry = {
-                "layer": layer,
-                "response": response,
-                "context": context or {},
-            }
-            f.write(json.dumps(entry) + "\n")
+        entry = {
+            "layer": layer,
+            "response": response,
+            "context": context or {},
+        }
+        f.write(json.dumps(entry) + "\n")
     
     # Return both the logger function and the path for inspection
     log.path = log_file
-    return log
+    yield log
+    f.close()
@@ -1,292 +1,174 @@
 """Integration tests for all canonical templates (B, C, D, E, F, G)."""
 
+import re
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, NamedTuple
+
 import pytest
 
-from omen.vocabulary import TemplateID, StakesLevel, QualityTier
+from omen.orchestrator import StepResult
+from omen.vocabulary import TemplateID, StakesLevel, QualityTier, ToolsState
 
 
-@pytest.mark.integration
-class TestTemplateBIntegration:
-    """Integration tests for Template B (Verification Loop)."""
-    
-    def test_template_b_execution(self, integration_orchestrator):
-        """Execute Template B (Verification Loop) with real LLM."""
-        result = integration_orchestrator.run_template(
-            TemplateID.TEMPLATE_B,
-            stakes_level=StakesLevel.MEDIUM,
-            quality_tier=QualityTier.PAR,
-        )
-        
-        print(f"\n{'='*60}")
-        print(f"TEMPLATE B: VERIFICATION LOOP")
-        print(f"{'='*60}")
-        print(f"Success: {result.success}")
-        print(f"Steps: {result.step_count}")
-        print(f"Duration: {result.total_duration_seconds:.2f}s")
-        print(f"Errors: {result.errors}")
-        
-        print(f"\n{'='*60}")
-        print(f"VERIFICATION FLOW")
-        print(f"{'='*60}")
-        for i, step in enumerate(result.steps_completed, 1):
-            print(f"\n[Step {i}] {step.step_id}")
-            print(f"  Success: {step.success}")
-            print(f"  Packets: {step.packets_emitted}")
-            
-            if step.output and step.output.raw_response:
-                response_lower = step.output.raw_response.lower()
-                if any(kw in response_lower for kw in ['verify', 'verification', 'plan', 'evidence']):
-                    print(f"  ✓ Contains verification keywords")
-                    preview = step.output.raw_response[:150].replace("\n", " ")
-                    print(f"  Preview: {preview}...")
-        
-        print(f"\n{'='*60}\n")
-        
-        assert result.step_count > 0, "Should execute at least one step"
+# Report banners
+_RULE = "=" * 60
+_WIDE_RULE = "=" * 70
 
+# Gate predicate: (packet dict, step that emitted it) -> packet counts for the gate
+GatePredicate = Callable[[dict[str, Any], StepResult], bool]
 
-@pytest.mark.integration
-class TestTemplateCIntegration:
-    """Integration tests for Template C (Read-Only Act)."""
-    
-    def test_template_c_execution(self, integration_orchestrator):
-        """Execute Template C (Read-Only Act) with real LLM."""
-        result = integration_orchestrator.run_template(
-            TemplateID.TEMPLATE_C,
-            stakes_level=StakesLevel.LOW,
-            quality_tier=QualityTier.PAR,
-            initial_packets=[{
-                "type": "seed",
-                "content": "User requested to read current system status",
-            }],
-        )
-        
-        print(f"\n{'='*60}")
-        print(f"TEMPLATE C: READ-ONLY ACT")
-        print(f"{'='*60}")
-        print(f"Success: {result.success}")
-        print(f"Steps: {result.step_count}")
-        print(f"Duration: {result.total_duration_seconds:.2f}s")
-        
-        print(f"\n{'='*60}")
-        print(f"ACT DECISION & EXECUTION")
-        print(f"{'='*60}")
-        for i, step in enumerate(result.steps_completed, 1):
-            print(f"\n[Step {i}] {step.step_id}")
-            print(f"  Success: {step.success}")
-            
-            if step.output and step.output.packets:
-                for pkt in step.output.packets:
-                    if isinstance(pkt, dict):
-                        pkt_type = pkt.get("type", "unknown")
-                        print(f"    Packet: {pkt_type}")
-                        
-                        if pkt_type == "DecisionPacket" and pkt.get("decision_outcome") == "ACT":
-                            print(f"    ✓ ACT decision confirmed")
-                        
-                        if pkt_type == "TaskResultPacket":
-                            print(f"    ✓ Task executed: {pkt.get('status', 'unknown')}")
-        
-        print(f"\n{'='*60}\n")
-        
-        assert result.step_count > 0
 
+def _of_type(pkt_type: str) -> GatePredicate:
+    """Gate matching every packet of one type."""
+    return lambda pkt, step: pkt.get("type") == pkt_type
 
-@pytest.mark.integration
-class TestTemplateDIntegration:
-    """Integration tests for Template D (Write Act)."""
-    
-    def test_template_d_execution(self, integration_orchestrator):
-        """Execute Template D (Write Act) with real LLM."""
-        result = integration_orchestrator.run_template(
-            TemplateID.TEMPLATE_D,
-            stakes_level=StakesLevel.HIGH,
-            quality_tier=QualityTier.SUPERB,
-            initial_packets=[{
-                "type": "seed",
-                "content": "User authorized: Update configuration file with new settings",
-            }],
-        )
-        
-        print(f"\n{'='*60}")
-        print(f"TEMPLATE D: WRITE ACT")
-        print(f"{'='*60}")
-        print(f"Success: {result.success}")
-        print(f"Steps: {result.step_count}")
-        print(f"Duration: {result.total_duration_seconds:.2f}s")
-        
-        print(f"\n{'='*60}")
-        print(f"AUTHORIZATION & WRITE EXECUTION")
-        print(f"{'='*60}")
-        
-        auth_token_found = False
-        task_result_found = False
-        
-        for i, step in enumerate(result.steps_completed, 1):
-            print(f"\n[Step {i}] {step.step_id}")
-            print(f"  Success: {step.success}")
-            
-            if step.output and step.output.packets:
-                for pkt in step.output.packets:
-                    if isinstance(pkt, dict):
-                        pkt_type = pkt.get("type", "unknown")
-                        print(f"    Packet: {pkt_type}")
-                        
-                        if pkt_type == "ToolAuthorizationToken":
-                            auth_token_found = True
-                            print(f"    ✓ Authorization token issued")
-                        
-                        if pkt_type == "TaskResultPacket":
-                            task_result_found = True
-                            print(f"    ✓ Write task executed: {pkt.get('status', 'unknown')}")
-        
-        print(f"\n{'='*60}")
-        print(f"WRITE SAFETY CHECKS")
-        print(f"{'='*60}")
-        print(f"  Authorization token: {'✓ Found' if auth_token_found else '✗ Not found'}")
-        print(f"  Task execution: {'✓ Found' if task_result_found else '✗ Not found'}")
-        print(f"\n{'='*60}\n")
-        
-        assert result.step_count > 0
 
+def _act_decision(pkt: dict[str, Any], step: StepResult) -> bool:
+    return pkt.get("type") == "DecisionPacket" and pkt.get("decision_outcome") == "ACT"
 
-@pytest.mark.integration
-class TestTemplateFIntegration:
-    """Integration tests for Template F (Degraded Tools)."""
+
+def _review_update(pkt: dict[str, Any], step: StepResult) -> bool:
+    return pkt.get("type") == "BeliefUpdatePacket" and "review" in step.step_id.lower()
+
+
+class TemplateCase(NamedTuple):
+    """One template run and what its report should look for."""
+    template_id: TemplateID
+    stakes: StakesLevel
+    tier: QualityTier
+    title: str
+    seed: str | None = None
+    tools_state: ToolsState | None = None
+    # Report label -> predicate selecting the packets that satisfy it
+    gates: tuple[tuple[str, GatePredicate], ...] = ()
+    # Raw-response keywords worth previewing
+    keywords: re.Pattern[str] | None = None
+
+
+TEMPLATE_CASES = [
+    TemplateCase(
+        TemplateID.TEMPLATE_B, StakesLevel.MEDIUM, QualityTier.PAR,
+        title="VERIFICATION LOOP",
+        keywords=re.compile(r"verif(?:y|ication)|plan|evidence", re.IGNORECASE),
+    ),
+    TemplateCase(
+        TemplateID.TEMPLATE_C, StakesLevel.LOW, QualityTier.PAR,
+        title="READ-ONLY ACT",
+        seed="User requested to read current system status",
+        gates=(("ACT decision", _act_decision), ("Task execution", _of_type("TaskResultPacket"))),
+    ),
+    TemplateCase(
+        TemplateID.TEMPLATE_D, StakesLevel.HIGH, QualityTier.SUPERB,
+        title="WRITE ACT",
+        seed="User authorized: Update configuration file with new settings",
+        gates=(
+            ("Authorization token", _of_type("ToolAuthorizationToken")),
+            ("Task execution", _of_type("TaskResultPacket")),
+        ),
+    ),
+    TemplateCase(
+        TemplateID.TEMPLATE_F, StakesLevel.MEDIUM, QualityTier.PAR,
+        title="DEGRADED TOOLS",
+        seed="System is in degraded mode - some tools unavailable",
+        tools_state=ToolsState.TOOLS_PARTIAL,  # Template F requires degraded tools
+        gates=(
+            ("Observations", _of_type("ObservationPacket")),
+            ("Decisions", _of_type("DecisionPacket")),
+            ("Escalations", _of_type("EscalationPacket")),
+        ),
+    ),
+    TemplateCase(
+        TemplateID.TEMPLATE_G, StakesLevel.HIGH, QualityTier.SUPERB,
+        title="COMPILE-TO-CODE",
+        seed="Generate code for a simple data validation function with tests",
+        gates=(
+            ("Planning", _of_type("VerificationPlanPacket")),
+            ("Authorization", _of_type("ToolAuthorizationToken")),
+            ("Execution", _of_type("TaskResultPacket")),
+            ("Review", _review_update),
+        ),
+    ),
+]
+
+
+def _summarize_result(result, case: TemplateCase) -> None:
+    """Print the episode report, with how many packets satisfied each gate."""
+    gate_counts = dict.fromkeys((label for label, _ in case.gates), 0)
     
-    def test_template_f_degraded_mode(self, integration_orchestrator):
-        """Execute Template F (Degraded Tools) with real LLM."""
-        from omen.vocabulary import ToolsState
-        
-        result = integration_orchestrator.run_template(
-            TemplateID.TEMPLATE_F,
-            stakes_level=StakesLevel.MEDIUM,
-            quality_tier=QualityTier.PAR,
-            tools_state=ToolsState.TOOLS_PARTIAL,  # Template F requires degraded tools
-            initial_packets=[{
-                "type": "seed",
-                "content": "System is in degraded mode - some tools unavailable",
-            }],
-        )
-        
-        print(f"\n{'='*60}")
-        print(f"TEMPLATE F: DEGRADED TOOLS")
-        print(f"{'='*60}")
-        print(f"Success: {result.success}")
-        print(f"Steps: {result.step_count}")
-        print(f"Duration: {result.total_duration_seconds:.2f}s")
-        
-        print(f"\n{'='*60}")
-        print(f"DEGRADED MODE HANDLING")
-        print(f"{'='*60}")
-        
-        observations = []
-        decisions = []
-        escalations = []
-        
-        for i, step in enumerate(result.steps_completed, 1):
-            print(f"\n[Step {i}] {step.step_id}")
-            print(f"  Success: {step.success}")
-            
-            if step.output and step.output.packets:
-                for pkt in step.output.packets:
-                    if isinstance(pkt, dict):
-                        pkt_type = pkt.get("type", "unknown")
-                        print(f"    Packet: {pkt_type}")
-                        
-                        if pkt_type == "ObservationPacket":
-                            observations.append(pkt)
-                        elif pkt_type == "DecisionPacket":
-                            decisions.append(pkt)
-                        elif pkt_type == "EscalationPacket":
-                            escalations.append(pkt)
-        
-        print(f"\n{'='*60}")
-        print(f"DEGRADED MODE BEHAVIOR")
-        print(f"{'='*60}")
-        print(f"  Observations: {len(observations)}")
-        print(f"  Decisions: {len(decisions)}")
-        print(f"  Escalations: {len(escalations)}")
-        print(f"\n{'='*60}\n")
-        
-        assert result.step_count > 0
+    print(f"\n{_RULE}")
+    print(f"{case.template_id.value}: {case.title}")
+    print(_RULE)
+    print(f"Success: {result.success}")
+    print(f"Steps: {result.step_count}")
+    print(f"Duration: {result.total_duration_seconds:.2f}s")
+    print(f"Errors: {result.errors}")
+    
+    for i, step in enumerate(result.steps_completed, 1):
+        print(f"\n[Step {i}] {step.step_id}")
+        print(f"  Success: {step.success}")
+        print(f"  Packets: {step.packets_emitted}")
+        
+        output = step.output
+        if output is None:
+            continue
+        
+        if case.keywords and output.raw_response:
+            if case.keywords.search(output.raw_response):
+                print(f"  ✓ Contains {case.title.lower()} keywords")
+                preview = output.raw_response[:150].replace("\n", " ")
+                print(f"  Preview: {preview}...")
+        
+        for pkt in output.packets:
+            if isinstance(pkt, dict):
+                pkt_type = pkt.get("type", "unknown")
+                print(f"    Packet: {pkt_type}")
+                for label, matches in case.gates:
+                    if matches(pkt, step):
+                        gate_counts[label] += 1
+    
+    if gate_counts:
+        print(f"\n{_RULE}")
+        print(f"GATES")
+        print(_RULE)
+        for label, count in gate_counts.items():
+            print(f"  {label}: {f'✓ Found ({count})' if count else '✗ Not found'}")
+    print(f"\n{_RULE}\n")
 
 
+# Module-level rather than in a class so xdist can hand each case to a
+# different worker; see tests/integration/conftest.py
 @pytest.mark.integration
-class TestTemplateGIntegration:
-    """Integration tests for Template G (Compile-to-Code)."""
+@pytest.mark.parametrize(
+    "case", TEMPLATE_CASES, ids=[case.template_id.value for case in TEMPLATE_CASES]
+)
+def test_template_execution(integration_orchestrator, case: TemplateCase):
+    """Execute a template end to end with real LLM."""
+    kwargs = {}
+    if case.tools_state:
+        kwargs["tools_state"] = case.tools_state
+    if case.seed:
+        kwargs["initial_packets"] = [{"type": "seed", "content": case.seed}]
     
-    def test_template_g_execution(self, integration_orchestrator):
-        """Execute Template G (Compile-to-Code) with real LLM."""
-        result = integration_orchestrator.run_template(
-            TemplateID.TEMPLATE_G,
-            stakes_level=StakesLevel.HIGH,
-            quality_tier=QualityTier.SUPERB,
-            initial_packets=[{
-                "type": "seed",
-                "content": "Generate code for a simple data validation function with tests",
-            }],
-        )
-        
-        print(f"\n{'='*60}")
-        print(f"TEMPLATE G: COMPILE-TO-CODE")
-        print(f"{'='*60}")
-        print(f"Success: {result.success}")
-        print(f"Steps: {result.step_count}")
-        print(f"Duration: {result.total_duration_seconds:.2f}s")
-        
-        print(f"\n{'='*60}")
-        print(f"COMPILATION WORKFLOW")
-        print(f"{'='*60}")
-        
-        has_plan = False
-        has_auth = False
-        has_execution = False
-        has_review = False
-        
-        for i, step in enumerate(result.steps_completed, 1):
-            print(f"\n[Step {i}] {step.step_id}")
-            print(f"  Success: {step.success}")
-            
-            if step.output and step.output.packets:
-                for pkt in step.output.packets:
-                    if isinstance(pkt, dict):
-                        pkt_type = pkt.get("type", "unknown")
-                        print(f"    Packet: {pkt_type}")
-                        
-                        if pkt_type == "VerificationPlanPacket":
-                            has_plan = True
-                            print(f"    ✓ Compilation plan created")
-                        elif pkt_type == "ToolAuthorizationToken":
-                            has_auth = True
-                            print(f"    ✓ Write authorization granted")
-                        elif pkt_type == "TaskResultPacket":
-                            has_execution = True
-                            status = pkt.get("status", "unknown")
-                            print(f"    ✓ Compilation executed: {status}")
-                        elif pkt_type == "BeliefUpdatePacket" and "review" in step.step_id.lower():
-                            has_review = True
-                            print(f"    ✓ Compilation reviewed")
-        
-        print(f"\n{'='*60}")
-        print(f"COMPILATION GATES")
-        print(f"{'='*60}")
-        print(f"  Planning: {'✓' if has_plan else '✗'}")
-        print(f"  Authorization: {'✓' if has_auth else '✗'}")
-        print(f"  Execution: {'✓' if has_execution else '✗'}")
-        print(f"  Review: {'✓' if has_review else '✗'}")
-        print(f"\n{'='*60}\n")
-        
-        assert result.step_count > 0
+    result = integration_orchestrator.run_template(
+        case.template_id,
+        stakes_level=case.stakes,
+        quality_tier=case.tier,
+        **kwargs,
+    )
+    
+    _summarize_result(result, case)
+    
+    assert result.step_count > 0, "Should execute at least one step"
 
 
 @pytest.mark.integration
 class TestTemplateComprehensive:
     """Comprehensive tests across multiple templates."""
     
-    def test_all_templates_execute(self, integration_orchestrator):
+    def test_all_templates_execute(self, openai_client):
         """Verify all templates can execute without fatal errors."""
-        from omen.vocabulary import ToolsState
+        from omen.orchestrator import create_orchestrator
         
         templates_to_test = [
             (TemplateID.TEMPLATE_A, StakesLevel.LOW, QualityTier.PAR, None),
@@ -298,15 +180,9 @@ class TestTemplateComprehensive:
             (TemplateID.TEMPLATE_G, StakesLevel.HIGH, QualityTier.SUPERB, None),
         ]
         
-        results_summary = []
-        
-        print(f"\n{'='*70}")
-        print(f"COMPREHENSIVE TEMPLATE SUITE TEST")
-        print(f"{'='*70}\n")
-        
-        for template_id, stakes, tier, tools_state in templates_to_test:
-            print(f"Testing {template_id.value}...")
-            
+        def run_one(template_id, stakes, tier, tools_state):
+            # Each episode gets its own orchestrator: the layer pool and buses
+            # are not shared across threads. The OpenAI client is.
             try:
                 kwargs = {
                     "stakes_level": stakes,
@@ -315,37 +191,50 @@ class TestTemplateComprehensive:
                 if tools_state:
                     kwargs["tools_state"] = tools_state
                     
-                result = integration_orchestrator.run_template(
+                result = create_orchestrator(llm_client=openai_client).run_template(
                     template_id,
                     **kwargs
                 )
                 
-                results_summary.append({
+                status = "✓" if result.success else "⚠"
+                line = (f"  {status} {template_id.value}: {result.step_count} steps, "
+                        f"{result.total_duration_seconds:.1f}s\n")
+                return line, {
                     "template": template_id.value,
                     "success": result.success,
                     "steps": result.step_count,
                     "duration": result.total_duration_seconds,
                     "errors": len(result.errors) if result.errors else 0,
-                })
-                
-                status = "✓" if result.success else "⚠"
-                print(f"  {status} {template_id.value}: {result.step_count} steps, "
-                      f"{result.total_duration_seconds:.1f}s\n")
+                }
                 
             except Exception as e:
-                print(f"  ✗ {template_id.value}: FAILED - {str(e)[:100]}\n")
-                results_summary.append({
+                return f"  ✗ {template_id.value}: FAILED - {str(e)[:100]}\n", {
                     "template": template_id.value,
                     "success": False,
                     "steps": 0,
                     "duration": 0,
                     "errors": 1,
                     "exception": str(e)[:100],
-                })
+                }
+        
+        print(f"\n{_WIDE_RULE}")
+        print(f"COMPREHENSIVE TEMPLATE SUITE TEST")
+        print(f"{_WIDE_RULE}\n")
+        
+        # Episodes are independent and bound by LLM latency, so run them
+        # concurrently; wall time drops from the sum to the slowest episode
+        with ThreadPoolExecutor(max_workers=len(templates_to_test)) as executor:
+            outcomes = list(executor.map(lambda case: run_one(*case), templates_to_test))
+        
+        results_summary = []
+        for (template_id, *_), (line, summary) in zip(templates_to_test, outcomes):
+            print(f"Testing {template_id.value}...")
+            print(line)
+            results_summary.append(summary)
         
-        print(f"\n{'='*70}")
+        print(f"\n{_WIDE_RULE}")
         print(f"SUMMARY")
-        print(f"{'='*70}")
+        print(_WIDE_RULE)
         
         total_steps = sum(r["steps"] for r in results_summary)
         total_duration = sum(r["duration"] for r in results_summary)
@@ -357,15 +246,15 @@ class TestTemplateComprehensive:
         print(f"Total duration: {total_duration:.1f}s")
         print(f"Average per template: {total_duration/len(results_summary):.1f}s")
         
-        print(f"\n{'='*70}")
+        print(f"\n{_WIDE_RULE}")
         print(f"DETAILED RESULTS")
-        print(f"{'='*70}")
+        print(_WIDE_RULE)
         for r in results_summary:
             status = "✓" if r["success"] else "✗"
             print(f"{status} {r['template']:15} | Steps: {r['steps']:2} | "
                   f"Duration: {r['duration']:5.1f}s | Errors: {r['errors']}")
         
-        print(f"\n{'='*70}\n")
+        print(f"\n{_WIDE_RULE}\n")
         
         # Assert at least some templates executed successfully
         assert successful > 0, "No templates executed successfully"
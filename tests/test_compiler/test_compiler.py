@@ -142,6 +142,44 @@ class TestCompiledEpisode:
         """get_step returns None for missing step."""
         assert sample_episode.get_step("nonexistent") is None
     
+    def test_get_step_sees_appended_steps(self, sample_episode):
+        """Step lookup stays correct when steps are added after a lookup."""
+        assert sample_episode.get_step("review") is None
+        sample_episode.steps.append(CompiledStep(
+            step_id="review",
+            sequence_number=3,
+            owner_layer=LayerSource.LAYER_5,
+            fsm_state=FSMState.S7_REVIEW,
+            packet_type=None,
+        ))
+        assert sample_episode.get_step("review").sequence_number == 3
+    
+    def test_get_step_sees_replaced_step(self, sample_episode):
+        """Replacing a step in place is picked up by a later lookup."""
+        assert sample_episode.get_step("sense") is sample_episode.steps[1]
+        replacement = CompiledStep(
+            step_id="model",
+            sequence_number=1,
+            owner_layer=LayerSource.LAYER_5,
+            fsm_state=FSMState.S2_MODEL,
+            packet_type=None,
+        )
+        sample_episode.steps[1] = replacement
+        assert sample_episode.get_step("sense") is None
+        assert sample_episode.get_step("model") is replacement
+    
+    def test_get_step_returns_first_duplicate(self, sample_episode):
+        """With duplicate step_ids the first occurrence wins."""
+        first = sample_episode.get_step("sense")
+        sample_episode.steps.append(CompiledStep(
+            step_id="sense",
+            sequence_number=9,
+            owner_layer=LayerSource.LAYER_5,
+            fsm_state=FSMState.S1_SENSE,
+            packet_type=None,
+        ))
+        assert sample_episode.get_step("sense") is first
+    
     def test_get_next_steps_from_start(self, sample_episode):
         """get_next_steps returns entry when current is None."""
         sample_episode.current_step = None
@@ -235,6 +273,17 @@ class TestTemplateCompiler:
         entry_step = result.episode.get_step("decide_verify")
         assert entry_step.mcp_bindings.get("decision_outcome") == "VERIFY_FIRST"
     
+    def test_compile_shares_context_sections_across_steps(self, compiler):
+        """Context-derived sections are built once per compile, not per step."""
+        ctx = create_context()
+        result = compiler.compile(TEMPLATE_B, ctx)
+        
+        first, second = result.episode.steps[0], result.episode.steps[1]
+        assert first.mcp_bindings is not second.mcp_bindings
+        assert first.mcp_bindings["stakes"] is second.mcp_bindings["stakes"]
+        overridden = [s for s in result.episode.steps if "decision_outcome" in s.mcp_bindings]
+        assert 0 < len(overridden) < len(result.episode.steps)
+    
     def test_compile_with_validation(self, validating_compiler):
         """Compiler validates template before compilation."""
         ctx = create_context()
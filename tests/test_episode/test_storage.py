@@ -114,6 +114,16 @@ class TestInMemoryStore:
         store.save(sample_episode)
         assert store.count() == 1
     
+    def test_save_many(self, store):
+        """Batch save stores every episode."""
+        episodes = [
+            EpisodeRecord(correlation_id=uuid4(), template_id="A", started_at=datetime.now(), success=True)
+            for _ in range(3)
+        ]
+        store.save_many(episodes)
+        assert store.count() == 3
+        assert store.load(episodes[1].correlation_id) is episodes[1]
+    
     def test_clear(self, store, sample_episode):
         """Clear all episodes."""
         store.save(sample_episode)
@@ -264,6 +274,16 @@ class TestSQLiteStore:
         store.save(sample_episode)
         assert store.count() == 1
     
+    def test_save_many(self, store):
+        """Batch save stores every episode in one transaction."""
+        episodes = [
+            EpisodeRecord(correlation_id=uuid4(), template_id="A", started_at=datetime.now(), success=True)
+            for _ in range(3)
+        ]
+        store.save_many(episodes)
+        assert store.count() == 3
+        assert store.load(episodes[1].correlation_id).template_id == "A"
+    
     def test_clear(self, store, sample_episode):
         """Clear all episodes."""
         store.save(sample_episode)
@@ -181,6 +181,13 @@ class TestTransitionTable:
             assert FSMState.S9_SAFEMODE in LEGAL_TRANSITIONS[state], \
                 f"SAFEMODE not reachable from {state}"
 
+    def test_precompiled_checks_match_table(self):
+        """Precompiled per-state checks agree with LEGAL_TRANSITIONS."""
+        from omen.validation.fsm_validator import _CAN_TRANSITION
+        for state, next_states in LEGAL_TRANSITIONS.items():
+            for target in FSMState:
+                assert _CAN_TRANSITION[state](target) == (target in next_states)
+
     def test_idle_is_initial_state(self):
         """S0_IDLE should be the starting state."""
         episode = EpisodeState(episode_id=uuid4())
@@ -756,6 +763,56 @@ class TestEpisodeState:
         assert episode.current_state == FSMState.S0_IDLE
         assert len(episode.state_history) == 0
 
+    def test_tracks_visited_decide_and_authorize(self):
+        """transition_to records DECIDE/AUTHORIZE visits."""
+        episode = EpisodeState(episode_id=uuid4())
+        assert not episode.decide_seen and not episode.authorize_seen
+        
+        episode.transition_to(FSMState.S3_DECIDE)
+        episode.transition_to(FSMState.S5_AUTHORIZE)
+        episode.transition_to(FSMState.S6_EXECUTE)
+        assert episode.decide_seen and episode.authorize_seen
+
+    def test_reset_does_not_leak_into_other_episodes(self, validator, episode_id):
+        """Resetting one episode leaves others intact."""
+        other_id = uuid4()
+        other = validator.get_or_create_episode(other_id)
+        other.transition_to(FSMState.S1_SENSE)
+        
+        validator.get_or_create_episode(episode_id)
+        validator.reset_episode(episode_id)
+        third = validator.get_or_create_episode(uuid4())
+        
+        assert third.current_state == FSMState.S0_IDLE
+        assert validator.get_or_create_episode(other_id) is other
+        assert other.current_state == FSMState.S1_SENSE
+
+
+# =============================================================================
+# BATCH VALIDATION TESTS
+# =============================================================================
+
+class TestValidateMany:
+    """Tests for FSMValidator.validate_many."""
+
+    def test_matches_sequential_results(self, base_header, base_mcp, valid_observation_payload, valid_belief_update_payload, valid_task_directive_payload):
+        packets = [
+            ObservationPacket(header=base_header("ObservationPacket"), mcp=base_mcp, payload=valid_observation_payload),
+            BeliefUpdatePacket(header=base_header("BeliefUpdatePacket"), mcp=base_mcp, payload=valid_belief_update_payload),
+            ObservationPacket(header=base_header("ObservationPacket"), mcp=base_mcp, payload=valid_observation_payload),
+            TaskDirectivePacket(header=base_header("TaskDirectivePacket"), mcp=base_mcp, payload=valid_task_directive_payload),
+        ]
+        sequential = FSMValidator()
+        expected = [sequential.validate_transition(p) for p in packets]
+        
+        results = FSMValidator().validate_many(packets)
+        
+        assert [r.valid for r in results] == [e.valid for e in expected]
+        assert [r.valid for r in results] == [True, True, True, False]
+
+    def test_empty_batch(self, validator):
+        assert validator.validate_many([]) == []
+
 
 # =============================================================================
 # FACTORY FUNCTION TESTS
@@ -14,6 +14,7 @@ from omen.validation import (
     create_invariant_validator,
     ValidationResult,
 )
+from omen.validation.invariant_validator import OVERRUN_TIME
 from omen.schemas import (
     DecisionPacket,
     TaskDirectivePacket,
@@ -544,12 +545,71 @@ class TestBudgetLedger:
         assert is_overrun is True
         assert "tokens" in details[0]
 
+    def test_any_overrun_mask(self, episode_id):
+        ledger = BudgetLedger(
+            episode_id=episode_id,
+            token_budget=100,
+            tokens_consumed=50,
+            time_budget_seconds=10,
+            time_elapsed_seconds=20,
+        )
+        mask = ledger.any_overrun()
+        assert mask == OVERRUN_TIME
+        assert ledger.overrun_details(mask) == ["time: 20s/10s"]
+
+    def test_no_overrun_mask_is_zero(self, episode_id):
+        ledger = BudgetLedger(episode_id=episode_id, token_budget=100, tokens_consumed=100)
+        assert ledger.any_overrun() == 0
+        assert ledger.is_overrun() == (False, [])
+
     def test_reset_episode(self, validator, episode_id):
         validator.update_budget_consumption(episode_id, tokens=50)
         validator.reset_episode(episode_id)
         ledger = validator.get_or_create_ledger(episode_id)
         assert ledger.tokens_consumed == 0
 
+    def test_reset_does_not_recycle_ledger(self, validator, episode_id):
+        validator.update_budget_consumption(episode_id, tokens=500)
+        validator.approve_budget_overrun(episode_id, "LAYER_1")
+        released = validator.get_or_create_ledger(episode_id)
+        validator.reset_episode(episode_id)
+        
+        other_id = uuid4()
+        ledger = validator.get_or_create_ledger(other_id)
+        assert ledger is not released
+        assert released.tokens_consumed == 500
+        assert ledger.episode_id == other_id
+        assert ledger.tokens_consumed == 0
+        assert ledger.budget_overrun_approved is False
+        assert ledger.overrun_approved_by is None
+
+
+# =============================================================================
+# BATCH VALIDATION TESTS
+# =============================================================================
+
+class TestValidateMany:
+    """Tests for InvariantValidator.validate_many."""
+
+    def test_results_in_input_order(self, validator, base_header, base_mcp):
+        def observation(has_evidence: bool) -> ObservationPacket:
+            return ObservationPacket(
+                header=base_header("ObservationPacket"),
+                mcp=base_mcp(status="OBSERVED", has_evidence=has_evidence),
+                payload={
+                    "observation_id": str(uuid4()),
+                    "source": {"source_type": "test", "source_id": "test"},
+                    "observation_type": "test_observation",
+                    "content": {"data": "test"},
+                    "observed_at": datetime.now(timezone.utc).isoformat(),
+                },
+            )
+        
+        results = validator.validate_many(
+            [observation(True), observation(False), observation(True)]
+        )
+        assert [r.valid for r in results] == [True, False, True]
+
 
 # =============================================================================
 # FACTORY FUNCTION TESTS
@@ -5,6 +5,7 @@ Validates structural correctness checking per OMEN.md §15.4.
 """
 
 import pytest
+from dataclasses import FrozenInstanceError
 from uuid import uuid4
 from datetime import datetime, timezone, timedelta
 
@@ -108,8 +109,11 @@ class TestValidationResult:
     def test_success(self):
         result = ValidationResult.success()
         assert result.valid is True
-        assert result.errors == []
-        assert result.warnings == []
+        assert result.errors == ()
+        assert result.warnings == ()
+
+    def test_success_is_shared(self):
+        assert ValidationResult.success() is ValidationResult.success()
 
     def test_failure(self):
         result = ValidationResult.failure(["error1", "error2"])
@@ -127,6 +131,11 @@ class TestValidationResult:
         merged = r1.merge(r2)
         assert merged.valid is True
 
+    def test_merge_with_success_returns_other_side(self):
+        failure = ValidationResult.failure(["error"])
+        assert failure.merge(ValidationResult.success()) is failure
+        assert ValidationResult.success().merge(failure) is failure
+
     def test_merge_failure_propagates(self):
         r1 = ValidationResult.success()
         r2 = ValidationResult.failure(["error"])
@@ -140,6 +149,14 @@ class TestValidationResult:
         merged = r1.merge(r2)
         assert len(merged.errors) == 2
 
+    def test_is_immutable(self):
+        """Results may be shared, so they cannot be mutated."""
+        result = ValidationResult.failure(["error"], ["warning"])
+        assert result.errors == ("error",)
+        assert result.warnings == ("warning",)
+        with pytest.raises(FrozenInstanceError):
+            result.valid = True
+
 
 # =============================================================================
 # HEADER VALIDATION TESTS
@@ -196,6 +213,17 @@ class TestMCPValidation:
         result = validator.validate(packet)
         assert result.valid is True
 
+    def test_clean_packets_share_success_result(self, validator, valid_header, valid_mcp, valid_decision_payload):
+        packet = DecisionPacket(
+            header=valid_header,
+            mcp=valid_mcp,
+            payload=valid_decision_payload,
+        )
+        first = validator.validate(packet)
+        assert first.valid is True
+        assert first.errors == () and first.warnings == ()
+        assert validator.validate(packet) is first
+
     def test_empty_intent_summary(self, validator, valid_header, valid_mcp, valid_decision_payload):
         valid_mcp["intent"]["summary"] = ""
         packet = DecisionPacket(
@@ -488,6 +516,59 @@ class TestEscalationValidation:
         assert any("what_we_know" in w or "what_we_believe" in w for w in result.warnings)
 
 
+# =============================================================================
+# DISPATCH TESTS
+# =============================================================================
+
+class TestDispatch:
+    """Tests for per-class validator specialization."""
+
+    def test_every_packet_class_is_prespecialized(self, validator):
+        """All packet classes, including payload-free ones, hit the O(1) table."""
+        from typing import get_args
+        from omen.validation import Packet
+        assert set(validator._validators) == set(get_args(Packet))
+
+    def test_subclass_keeps_base_payload_rules(self, validator, valid_header, valid_mcp, valid_decision_payload):
+        """Exact-type dispatch misses a subclass; it must still get payload checks."""
+        class CustomDecisionPacket(DecisionPacket):
+            pass
+
+        valid_decision_payload["load_bearing_assumptions"] = ["critical assumption"]
+        valid_decision_payload["assumptions"] = []
+        packet = CustomDecisionPacket(
+            header=valid_header,
+            mcp=valid_mcp,
+            payload=valid_decision_payload,
+        )
+        result = validator.validate(packet)
+        assert any("load_bearing_assumptions" in w for w in result.warnings)
+
+
+# =============================================================================
+# BATCH VALIDATION TESTS
+# =============================================================================
+
+class TestValidateMany:
+    """Tests for SchemaValidator.validate_many."""
+
+    def test_results_in_input_order(self, validator, valid_header, valid_mcp, valid_decision_payload):
+        clean = DecisionPacket(
+            header=valid_header,
+            mcp=valid_mcp,
+            payload=valid_decision_payload,
+        )
+        bad_mcp = {**valid_mcp, "intent": {**valid_mcp["intent"], "summary": ""}}
+        dirty = DecisionPacket(
+            header=valid_header,
+            mcp=bad_mcp,
+            payload=valid_decision_payload,
+        )
+        results = validator.validate_many([clean, dirty, clean])
+        assert [r.valid for r in results] == [True, False, True]
+        assert results[1].errors == validator.validate(dirty).errors
+
+
 # =============================================================================
 # CONVENIENCE FUNCTION TESTS
 # =============================================================================